@@ -8,6 +8,7 @@ import platform
 import pprint
 import subprocess
 import sys
+import time
 import zipfile
 from asyncio import gather
 from collections import defaultdict
@@ -15,7 +16,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 import yaml
 from aiopath import AsyncPath
@@ -98,6 +99,12 @@ class InstallationContext:
     Distribution dir is a storage location for mods.
     """
 
+    # archive extension -> name of method reading mod manifest from such archive
+    ARCHIVE_MANIFEST_READERS: ClassVar[dict[str, str]] = {
+        ".7z": "get_7z_mod_manifest_async",
+        ".zip": "get_zip_mod_manifest_async",
+    }
+
     def __init__(self, distribution_dir: str = "",
                  dev_mode: bool = False) -> None:
         self.dev_mode = dev_mode
@@ -431,8 +438,8 @@ class InstallationContext:
                 cached, root_path, file_list = cached_info
                 if cached is not None:
                     return cached, root_path, file_list, None
-        try:
-            await asyncio.sleep(0)
+        def read_manifest() -> tuple[dict | None, Path | None, list[zipfile.ZipInfo] | None,
+                                     Exception | None]:
             with zipfile.ZipFile(archive_path, "r") as archive:
                 if loading_text is not None:
                     uncompressed = sum([file.file_size for file in archive.filelist])
@@ -441,7 +448,6 @@ class InstallationContext:
                                           f"{compressed/1024/1024:.1f} MB -> "
                                           f"{uncompressed/1024/1024:.1f} MB")
                     loading_text.update()
-                    await asyncio.sleep(0)
                 file_list = archive.filelist
                 manifests = [file for file in file_list
                              if "manifest.yaml" in file.filename]
@@ -452,16 +458,20 @@ class InstallationContext:
                         manifest = load_yaml(manifest_b)
                         if manifest is None:
                             raise yaml.YAMLError("Invalid yaml found in archive")
-
-                        self.archived_mod_manifests_cache[archive_path] = (
-                            manifest, manifest_root_dir, file_list)
                         return manifest, manifest_root_dir, file_list, None
 
                 return None, None, None, ValueError("Manifest not found in archive or broken")
+
+        try:
+            # archive reading is blocking, worker thread allows to read multiple archives concurrently
+            manifest, manifest_root_dir, file_list, exception = await asyncio.to_thread(read_manifest)
         except Exception as ex:
             self.logger.exception("Error on ZIP manifest check")
             self.archived_mod_manifests_cache[archive_path] = (None, None, None)
             return None, None, None, ex
+        if manifest is not None:
+            self.archived_mod_manifests_cache[archive_path] = (manifest, manifest_root_dir, file_list)
+        return manifest, manifest_root_dir, file_list, exception
 
     async def get_7z_mod_manifest_async(
             self, archive_path: str | AsyncPath, ignore_cache: bool = False,
@@ -479,8 +489,8 @@ class InstallationContext:
                 cached, root_path, file_list = cached_info
                 if cached is not None:
                     return cached, root_path, file_list, None
-        try:
-            await asyncio.sleep(0)
+        def read_manifest() -> tuple[dict | None, Path | None, py7zr.ArchiveFileList | None,
+                                     Exception | None]:
             with py7zr.SevenZipFile(str(archive_path), "r") as archive:
                 if loading_text is not None:
                     info = archive.archiveinfo()
@@ -488,7 +498,6 @@ class InstallationContext:
                                           f"{info.size/1024/1024:.1f} MB -> "
                                           f"{info.uncompressed/1024/1024:.1f} MB")
                     loading_text.update()
-                    await asyncio.sleep(0)
                 file_list = archive.files
                 manifests = [file for file in file_list
                              if "manifest.yaml" in file.filename]
@@ -501,32 +510,30 @@ class InstallationContext:
                         manifest = load_yaml(manifest_b)
                         if manifest is None:
                             raise yaml.YAMLError("Invalid yaml found in archive")
-
-                        self.archived_mod_manifests_cache[archive_path] = (
-                            manifest, manifest_root_dir, file_list)
                         return manifest, manifest_root_dir, file_list, None
 
                 return None, None, None, ValueError("Manifest not found in archive or broken")
+
+        try:
+            # same as for zip, don't block event loop while reading archive
+            manifest, manifest_root_dir, file_list, exception = await asyncio.to_thread(read_manifest)
         except Exception as ex:
             self.logger.exception("Error on 7z manifest check")
             self.archived_mod_manifests_cache[archive_path] = (None, None, None)
             return None, None, None, ex
+        if manifest is not None:
+            self.archived_mod_manifests_cache[archive_path] = (manifest, manifest_root_dir, file_list)
+        return manifest, manifest_root_dir, file_list, exception
 
     async def get_archive_manifest(
             self, archive_path: str | AsyncPath, ignore_cache: bool = False,
-            loading_text: Text | None = None) -> tuple[dict | None, Exception | None]:
-        extension = Path(archive_path).suffix
-        match extension:
-            case ".7z":
-                manifest, manifest_root_dir, file_list, exception = await self.get_7z_mod_manifest_async(
-                    archive_path, loading_text=loading_text)
-            case ".zip":
-                manifest, manifest_root_dir, file_list, exception = await self.get_zip_mod_manifest_async(
-                    archive_path, loading_text=loading_text)
-            case _:
-                manifest, manifest_root_dir, file_list, exception = \
-                    None, None, None, TypeError("Unsuported archive type")
-        return manifest, manifest_root_dir, file_list, exception
+            loading_text: Text | None = None
+            ) -> tuple[dict | None, Path | None, list | None, Exception | None]:
+        reader_name = self.ARCHIVE_MANIFEST_READERS.get(Path(archive_path).suffix)
+        if reader_name is None:
+            return None, None, None, TypeError("Unsuported archive type")
+        return await getattr(self, reader_name)(
+            archive_path, ignore_cache=ignore_cache, loading_text=loading_text)
 
     async def get_archived_mod(
             self, archive_path: str | AsyncPath,
@@ -720,13 +727,24 @@ class GameInstallment(Enum):
         return [c.value for c in cls]
 
 
+# for membership checks, members never change so it's computed once
+GameInstallment.VALUES = frozenset(GameInstallment.list_values())
+
+
 class GameCopy:
     """Stores info about a processed HTA/EM game copy."""
 
+    # seconds for which result of check_is_running is reused
+    RUNNING_CHECK_TTL: ClassVar[float] = 0.2
+
     def __init__(self) -> None:
         self.logger = logging.getLogger("dem")
         self.installed_content = {}
         self.installed_descriptions = {}
+        self._installed_descriptions_text: str | None = None
+        self._installed_descriptions_lines: tuple[tuple[str, ...], ...] | None = None
+        self._is_running: bool = False
+        self._is_running_checked_at: float = 0.0
         self.patched_version = False
         self.leftovers = False
         self.target_exe = ""
@@ -747,6 +765,27 @@ class GameCopy:
             return " ... "
         return self.exe_version.replace("Remaster", "Rem")
 
+    @property
+    def installed_descriptions_text(self) -> str:
+        """All installed content descriptions joined for display.
+
+        Cached until descriptions are reloaded
+        """
+        if self._installed_descriptions_text is None:
+            self._installed_descriptions_text = "\n\n".join(self.installed_descriptions.values())
+        return self._installed_descriptions_text
+
+    @property
+    def installed_descriptions_lines(self) -> tuple[tuple[str, ...], ...]:
+        """Lines of each installed content description.
+
+        Cached until descriptions are reloaded
+        """
+        if self._installed_descriptions_lines is None:
+            self._installed_descriptions_lines = tuple(
+                tuple(description.split("\n")) for description in self.installed_descriptions.values())
+        return self._installed_descriptions_lines
+
     @staticmethod
     def validate_game_dir(game_root_path: str) -> tuple[bool, str]:
         """Check existence of expected basic file structure in a given game directory."""
@@ -788,13 +827,24 @@ class GameCopy:
         return True
 
     def check_is_running(self) -> bool:
+        """Check if game exe is locked by a running game.
+
+        Result of the process lookup is reused for RUNNING_CHECK_TTL, as a single page render
+        can check it several times; missing exe is always reported
+        """
         if not Path(self.target_exe).exists():
             raise ExeNotFoundError
 
-        if self.target_exe:
-            return self.get_exe_version(self.target_exe) is None
+        if time.monotonic() - self._is_running_checked_at < self.RUNNING_CHECK_TTL:
+            return self._is_running
 
-        return False
+        self._is_running = bool(self.target_exe) and self.get_exe_version(self.target_exe) is None
+        self._is_running_checked_at = time.monotonic()
+        return self._is_running
+
+    def reset_running_check(self) -> None:
+        """Force next check_is_running to look at the exe, e.g. after starting or stopping the game."""
+        self._is_running_checked_at = 0.0
 
     def refresh_game_launch_params(self, exclude_registry_params: bool = False) -> None:
         if self.exe_version != "unknown" and self.game_root_path:
@@ -919,6 +969,8 @@ class GameCopy:
         Does so based on existing short mod manifest of the game and optional list of full mod objects.
         """
         known_mod_names = []
+        self._installed_descriptions_text = None
+        self._installed_descriptions_lines = None
 
         if known_mods:
             known_mod_names = {mod.name for mod in known_mods.values()}
@@ -202,6 +202,12 @@ class Mod(BaseModel):
                 + f"[{self.installment.replace('exmachina', 'em')}]"
                 ), (" ", "_", "-"))
 
+    @computed_field(repr=False)
+    @cached_property
+    def id_str_lower(self) -> str:
+        """Case-folded id, used as a sort key."""
+        return self.id_str.lower()
+
     @computed_field(repr=False)
     @property
     def vanilla_mod(self) -> bool:
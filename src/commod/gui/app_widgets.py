@@ -1,17 +1,22 @@
 import asyncio
+import contextlib
 import logging
+import operator
 import os
 import platform
 import pprint
 import subprocess
+import time
 import traceback
-from collections.abc import Awaitable
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Iterator, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache, partial
 from http import HTTPStatus
 from pathlib import Path
+from typing import Any, ClassVar
 
 import aiofiles.os
 import aioshutil
@@ -60,24 +65,100 @@ from commod.helpers.errors import (
     NoModsFoundError,
 )
 from commod.helpers.file_ops import (
+    dump_yaml,
     extract_archive_from_to,
     get_internal_file_path,
     get_proc_by_names,
     load_yaml,
     open_dir_in_os,
+    read_yaml,
 )
 from commod.helpers.parse_ops import is_url_safe, process_markdown, str_to_md_format
 from commod.localisation.service import (
     SupportedLanguages,
     is_known_lang,
     tr,
+    tr_cap,
+    tr_upper,
 )
 
 CALLBACK_TIMEOUT = 100000
 DISPLAY_MODS_ON_HOMESCREEN_NUM = 5
+NEWS_REPO_URL = "https://raw.githubusercontent.com/DeusExMachinaTeam/ComModNews/main/"
+NEWS_CACHE_FILE = "news_cache.yaml"
 
 background_tasks = set()
 
+# (text color, container color) pairs for install wizard status capsules
+# currently active installation step
+_CAPSULE_ACTIVE = (ft.colors.ON_PRIMARY_CONTAINER, ft.colors.PRIMARY_CONTAINER)
+# step that can't be directly chosen by pressing the capsule
+_CAPSULE_UNREACHABLE = (ft.colors.ON_SURFACE, ft.colors.SURFACE)
+# step that was already processed but we can go back to it
+_CAPSULE_PASSED = (ft.colors.ON_SECONDARY_CONTAINER, ft.colors.SECONDARY_CONTAINER)
+_CAPSULE_PADDING = ft.padding.symmetric(horizontal=10, vertical=2)
+
+# layout values shared by many controls, created once as they're never mutated;
+# col dicts are plain dicts as Flet serialises them as is
+_COL_LIBRARY = {"xs": 12, "xl": 11, "xxl": 10}
+_COL_SETTINGS = {"xs": 12, "xl": 10, "xxl": 8}
+_SETTINGS_CARD_MARGIN = ft.margin.only(right=20, bottom=15)
+_PLACEHOLDER_CARD_PADDING = ft.padding.only(left=20, right=35, top=25, bottom=25)
+# launch screen: indent of info rows, gap before sections, last launch param spacing
+_HOME_INDENT_MARGIN = ft.margin.only(left=7)
+_HOME_SECTION_MARGIN = ft.margin.only(top=10)
+_HOME_PARAMS_MARGIN = ft.margin.only(bottom=10)
+_GAME_SELECTOR_MARGIN = ft.margin.only(left=-3)
+_MENU_ITEM_INDENT_MARGIN = ft.margin.only(left=15)
+_NEWS_PADDING = ft.padding.only(left=10, right=22)
+
+# theme colors used by launch screen builders, which run on every rebuild
+_COLOR_PRIMARY = ft.colors.PRIMARY
+_COLOR_ON_PRIMARY = ft.colors.ON_PRIMARY
+_COLOR_ON_BACKGROUND = ft.colors.ON_BACKGROUND
+_COLOR_SECONDARY = ft.colors.SECONDARY
+
+# styles of installed mods rows on the launch screen
+_MOD_ROW_STYLE = {"tight": True,
+                  "alignment": ft.MainAxisAlignment.START,
+                  "vertical_alignment": ft.CrossAxisAlignment.CENTER}
+_MOD_ROW_ICON_STYLE = {"size": 12, "expand": 1}
+_MOD_ROW_TEXT_STYLE = {"size": 12, "overflow": ft.TextOverflow.ELLIPSIS, "expand": 10}
+
+_GAME_ICONS = {
+    "exmachina_patched": get_internal_file_path("assets/icons/hta_comrem.png"),
+    "exmachina": get_internal_file_path("assets/icons/original_hta.png"),
+    "m113": get_internal_file_path("assets/icons/original_m113.png"),
+    "arcade": get_internal_file_path("assets/icons/original_arcade.png"),
+}
+
+_GAME_LOGOS = {
+    GameInstallment.EXMACHINA.value: get_internal_file_path("assets/em_logo.png"),
+    GameInstallment.M113.value: get_internal_file_path("assets/m113_logo.png"),
+    GameInstallment.ARCADE.value: get_internal_file_path("assets/arcade_logo.png"),
+}
+
+
+@lru_cache(maxsize=1)
+def _get_placeholder_md() -> str:
+    """Return the cached placeholder markdown shown in place of news, as it never changes at runtime."""
+    with open(get_internal_file_path("assets/placeholder.md"), encoding="utf-8") as fh:
+        return process_markdown(fh.read())
+
+
+_DEFAULT_BTN_STYLE = ft.ButtonStyle(
+    side={
+        ft.MaterialState.DISABLED: ft.BorderSide(width=1, color=ft.colors.TERTIARY)
+    },
+    color={
+        ft.MaterialState.DEFAULT: ft.colors.ON_PRIMARY,
+        ft.MaterialState.DISABLED: ft.colors.TERTIARY
+        },
+    bgcolor={
+        ft.MaterialState.DEFAULT: ft.colors.PRIMARY,
+        ft.MaterialState.DISABLED: ft.colors.SURFACE_VARIANT
+    })
+
 # TODO: separate to different submodules for different app screens
 
 @dataclass
@@ -90,7 +171,8 @@ class App:
     page: ft.Page
 
     # session: InstallationContext.Session | None = None
-    game_change_time: datetime | None = None
+    # time.monotonic() of the last change to game state made from ComMod
+    game_change_time: float = 0.0
 
     home: "HomeScreen | None" = None
     local_mods: "LocalModsScreen | None" = None
@@ -111,6 +193,18 @@ class App:
     def session(self) -> InstallationContext.Session:
         return self.context.current_session
 
+    @contextlib.contextmanager
+    def batched_update(self) -> Iterator[list[ft.Control]]:
+        """Collect controls changed inside the block to send them to client in a single update.
+
+        Batch is local to the block, which shouldn't await anything,
+        so no other task can change controls before they are sent
+        """
+        changed: list[ft.Control] = []
+        yield changed
+        if changed:
+            self.page.update(*changed)
+
     def is_current_page(
             self, page_type: "HomeScreen | LocalModsScreen | DownloadModsScreen | SettingsScreen") -> bool:
         return isinstance(self.content_column.content, page_type)
@@ -228,7 +322,7 @@ class App:
             return
 
         no_options = on_yes is None and on_no is None
-        title_text = tr("attention").capitalize() if title is None else title
+        title_text = tr_cap("attention") if title is None else title
 
         dlg = ft.AlertDialog(
             title=Row([Icon(ft.icons.INFO_OUTLINE, color=ft.colors.PRIMARY),
@@ -242,10 +336,10 @@ class App:
             actions=[
                 ft.TextButton("Ok", on_click=self.close_alert,
                               visible=no_options),
-                ft.TextButton(tr("yes").capitalize(),
+                ft.TextButton(tr_cap("yes"),
                               visible=not no_options,
                               on_click=on_yes if on_yes is not None else self.close_alert),
-                ft.TextButton(tr("no").capitalize(),
+                ft.TextButton(tr_cap("no"),
                               visible=not no_options,
                               on_click=on_no if on_no is not None else self.close_alert)
                 ],
@@ -303,7 +397,7 @@ class App:
             modal=True,
             title=Row([Icon(ft.icons.HOURGLASS_BOTTOM_ROUNDED,
                             color=ft.colors.PRIMARY),
-                       Text(tr("is_loading").capitalize())]),
+                       Text(tr_cap("is_loading"))]),
             shape=ft.RoundedRectangleBorder(radius=10),
             content=Row([
                 ft.ProgressRing(),
@@ -565,7 +659,7 @@ class GameCopyListItem(ft.Container):
         self.game_name = self.edit_name.value
         self.display_view.visible = True
         self.edit_view.visible = False
-        self.config.game_names[self.game_path] = self.game_name
+        self.config.set_game_name(self.game_path, self.game_name)
         self.update()
 
     async def status_changed(self, e: ft.ControlEvent) -> None:
@@ -611,7 +705,7 @@ class SettingsScreen(ft.Container):
             selected_index=self.app.config.current_game_filter,
             on_change=self.tabs_changed,
             animate_size=ft.animation.Animation(500, ft.AnimationCurve.DECELERATE),
-            tabs=[Tab(text=tr("all_versions").capitalize()),
+            tabs=[Tab(text=tr_cap("all_versions")),
                   Tab(text="Ex Machina"),
                   Tab(text="M113"),
                   Tab(text="Arcade")])
@@ -699,8 +793,8 @@ class SettingsScreen(ft.Container):
                           expand=15)]),
                 bgcolor=ft.colors.TERTIARY_CONTAINER, padding=10, border_radius=10,
                 clip_behavior=ft.ClipBehavior.ANTI_ALIAS,
-                col={"xs": 12, "xl": 10, "xxl": 8},
-                margin=ft.margin.only(right=20, bottom=15))
+                col=_COL_SETTINGS,
+                margin=_SETTINGS_CARD_MARGIN)
             ],
             alignment=ft.MainAxisAlignment.CENTER,
             animate_size=ft.animation.Animation(500, ft.AnimationCurve.DECELERATE),
@@ -719,8 +813,8 @@ class SettingsScreen(ft.Container):
                           expand=15)]),
                 bgcolor=ft.colors.TERTIARY_CONTAINER, padding=10, border_radius=10,
                 clip_behavior=ft.ClipBehavior.ANTI_ALIAS,
-                col={"xs": 12, "xl": 10, "xxl": 8},
-                margin=ft.margin.only(right=20, bottom=15))
+                col=_COL_SETTINGS,
+                margin=_SETTINGS_CARD_MARGIN)
             ],
             alignment=ft.MainAxisAlignment.CENTER,
             animate_size=ft.animation.Animation(500, ft.AnimationCurve.DECELERATE),
@@ -772,7 +866,7 @@ class SettingsScreen(ft.Container):
             )
 
         self.add_from_steam_btn = ft.FilledButton(
-            tr("add_to_list").capitalize(),
+            tr_cap("add_to_list"),
             icon=icons.ADD,
             on_click=self.add_steam,
             visible=False,
@@ -780,7 +874,7 @@ class SettingsScreen(ft.Container):
             )
 
         self.add_game_manual_btn = ft.FilledButton(
-            tr("add_to_list").capitalize(),
+            tr_cap("add_to_list"),
             icon=ft.icons.ADD,
             on_click=self.add_game_manual,
             visible=False,
@@ -788,7 +882,7 @@ class SettingsScreen(ft.Container):
             )
 
         self.add_distro_btn = ft.FilledButton(
-            tr("confirm_choice").capitalize(),
+            tr_cap("confirm_choice"),
             icon=ft.icons.CHECK_ROUNDED,
             on_click=self.add_distro,
             visible=False,
@@ -796,14 +890,14 @@ class SettingsScreen(ft.Container):
             )
 
         self.open_game_button = FloatingActionButton(
-            tr("choose_path").capitalize(),
+            tr_cap("choose_path"),
             icon=icons.FOLDER_OPEN,
             on_click=self.get_game_dir,
             mini=True, height=40, width=135,
             )
 
         self.open_distro_button = FloatingActionButton(
-            tr("choose_path").capitalize(),
+            tr_cap("choose_path"),
             icon=icons.FOLDER_OPEN,
             on_click=self.get_distro_dir,
             mini=True, height=40, width=135,
@@ -859,7 +953,7 @@ class SettingsScreen(ft.Container):
                     ref=self.no_games_for_filter_warning,
                     visible=not bool(self.app.config.known_games)),
                 self.list_of_games
-                ], col={"xs": 12, "xl": 10, "xxl": 8})
+                ], col=_COL_SETTINGS)
 
 
         self.distro_location_text = ft.Ref[Text]()
@@ -884,7 +978,7 @@ class SettingsScreen(ft.Container):
            animate_size=ft.animation.Animation(500, ft.AnimationCurve.EASE_IN_OUT),
            bgcolor=ft.colors.SECONDARY_CONTAINER, border_radius=20,
            padding=ft.padding.symmetric(horizontal=10),
-           col={"xs": 12, "xl": 10, "xxl": 8})
+           col=_COL_SETTINGS)
 
         langs = SupportedLanguages.list_values()
 
@@ -899,14 +993,14 @@ class SettingsScreen(ft.Container):
                         border_width=2,
                         border_radius=5,
                         on_change=self.change_app_lang,
-                        label=tr("app_lang").capitalize(),
+                        label=tr_cap("app_lang"),
                         value=self.app.config.lang,
                         prefix_icon=ft.icons.LANGUAGE_ROUNDED,
                         label_style=ft.TextStyle(size=13, weight=ft.FontWeight.BOLD),
                         text_style=ft.TextStyle(size=13, weight=ft.FontWeight.BOLD),
                         hint_style=ft.TextStyle(size=13, weight=ft.FontWeight.BOLD),
                         options=[
-                            ft.dropdown.Option(key=lang, text=tr(lang).capitalize()) for lang in langs
+                            ft.dropdown.Option(key=lang, text=tr_cap(lang)) for lang in langs
                             ]),
                     Icon(ft.icons.INFO_OUTLINE_ROUNDED,
                          opacity=0.7,
@@ -915,7 +1009,7 @@ class SettingsScreen(ft.Container):
                          color=ft.colors.TERTIARY,
                          opacity=0.7,
                          no_wrap=False)
-                    ]), col={"xs": 12, "xl": 10, "xxl": 8})
+                    ]), col=_COL_SETTINGS)
 
         self.override_incompat = ft.Container(
             Row([
@@ -924,7 +1018,7 @@ class SettingsScreen(ft.Container):
                     scale=0.7,
                     active_color=ft.colors.ERROR,
                     on_change=self.toggle_override_incompat),
-                Text(tr("override_incompat").capitalize(),
+                Text(tr_cap("override_incompat"),
                       color=ft.colors.ERROR,
                       weight=ft.FontWeight.W_500)
                 ], spacing=0), margin=0, padding=0,
@@ -936,14 +1030,14 @@ class SettingsScreen(ft.Container):
                     Column([
                         Image(src=get_internal_file_path("assets/icons/dem_logo.svg"),
                               fit=ft.ImageFit.CONTAIN),
-                        ft.Text(f'{(tr("version").capitalize())} {OWN_VERSION}\n{DATE}',
+                        ft.Text(f'{(tr_cap("version"))} {OWN_VERSION}\n{DATE}',
                                 size=10, weight=ft.FontWeight.W_300, text_align=ft.TextAlign.CENTER),
                               ],
                            spacing=5,
                            alignment=ft.MainAxisAlignment.CENTER,
                            horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                     Column([
-                        ft.Text(f'{tr("developers").capitalize()} DEM Community Mod Manager',
+                        ft.Text(f'{tr_cap("developers")} DEM Community Mod Manager',
                                 weight=ft.FontWeight.BOLD, size=12,
                                 color=ft.colors.PRIMARY),
                         ft.Text('Aleksandr "Seel" Parfenenkov', size=12),
@@ -973,7 +1067,7 @@ class SettingsScreen(ft.Container):
                 padding=ft.padding.only(left=35, right=75, top=15, bottom=15),
                 clip_behavior=ft.ClipBehavior.HARD_EDGE),
             elevation=5,
-            margin=ft.margin.only(right=20, bottom=15),
+            margin=_SETTINGS_CARD_MARGIN,
             # col={"xs": 8, "xl": 7, "xxl": 6},
         )
 
@@ -999,9 +1093,9 @@ class SettingsScreen(ft.Container):
                 ft.Container(ft.ResponsiveRow(controls=[
                     Row([
                         Icon(ft.icons.VIDEOGAME_ASSET_ROUNDED, color=ft.colors.ON_BACKGROUND),
-                        Text(value=tr("control_game_copies").upper(),
+                        Text(value=tr_upper("control_game_copies"),
                              theme_style=ft.TextThemeStyle.TITLE_SMALL)
-                        ], col={"xs": 12, "xl": 10, "xxl": 8}),
+                        ], col=_COL_SETTINGS),
                     self.view_list_of_games,
                     ft.Container(content=Column(
                         [ft.Container(Row([game_icon,
@@ -1048,16 +1142,16 @@ class SettingsScreen(ft.Container):
                         visible=bool(self.app.session.steam_game_paths)
                         )
                     ], alignment=ft.MainAxisAlignment.CENTER), border_radius=10, padding=15,
-                    margin=ft.margin.only(right=20, bottom=15),
+                    margin=_SETTINGS_CARD_MARGIN,
                     border=ft.border.all(1, ft.colors.SURFACE_VARIANT)),
                 ft.Container(ft.ResponsiveRow(
                     # controls of distro/comrem/mods folders
                     controls=[
                         Row([
                             ft.Icon(ft.icons.CREATE_NEW_FOLDER, color=ft.colors.ON_BACKGROUND),
-                            Text(value=tr("control_mod_folders").upper(),
+                            Text(value=tr_upper("control_mod_folders"),
                                  theme_style=ft.TextThemeStyle.TITLE_SMALL)
-                             ], col={"xs": 12, "xl": 10, "xxl": 8}),
+                             ], col=_COL_SETTINGS),
                         self.distro_display,
                         ft.Container(content=Column(
                             [ft.Container(Row([dem_icon,
@@ -1084,7 +1178,7 @@ class SettingsScreen(ft.Container):
                                      col={"xs": 12, "xl": 10, "xxl": 7}
                                      )], alignment=ft.MainAxisAlignment.CENTER
                                  ), border_radius=10, padding=15,
-                                 margin=ft.margin.only(right=20, bottom=15),
+                                 margin=_SETTINGS_CARD_MARGIN,
                     border=ft.border.all(1, ft.colors.SURFACE_VARIANT)),
                 ft.Container(
                     ft.ResponsiveRow(
@@ -1092,13 +1186,13 @@ class SettingsScreen(ft.Container):
                         controls=[
                             Row([
                                 ft.Icon(ft.icons.SETTINGS, color=ft.colors.ON_BACKGROUND),
-                                Text(value=tr("other_settings").upper(),
+                                Text(value=tr_upper("other_settings"),
                                      theme_style=ft.TextThemeStyle.TITLE_SMALL)
-                                 ], col={"xs": 12, "xl": 10, "xxl": 8}),
+                                 ], col=_COL_SETTINGS),
                             self.language_select,
                             self.override_incompat,
                             ], alignment=ft.MainAxisAlignment.CENTER, run_spacing=15
-                    ), border_radius=10, padding=15, margin=ft.margin.only(right=20, bottom=15),
+                    ), border_radius=10, padding=15, margin=_SETTINGS_CARD_MARGIN,
                     border=ft.border.all(1, ft.colors.SURFACE_VARIANT)),
                 ft.Row([self.about], alignment=ft.MainAxisAlignment.CENTER)
             ], spacing=0,
@@ -1367,7 +1461,7 @@ class SettingsScreen(ft.Container):
             await self.minimize_adding_game_manual()
             await self.minimize_adding_game_steam()
 
-            self.app.config.game_names[game_path] = set_game_name
+            self.app.config.set_game_name(game_path, set_game_name)
             self.filter.selected_index = 0
             for control in self.list_of_games.controls:
                 control.visible = True
@@ -1477,7 +1571,7 @@ class SettingsScreen(ft.Container):
             # self.filter.update()
             # self.view_list_of_games.update()
 
-        self.app.config.game_names.pop(item.game_path)
+        self.app.config.remove_game(item.game_path)
         self.app.logger.debug(f"Game is now: {self.app.game.target_exe}")
         self.app.logger.debug(f"Distro dir: {self.app.config.current_distro}")
 
@@ -1823,16 +1917,16 @@ class ModInfo(ft.Container):
 
     async def set_tabs(self) -> None:
         self.tabs.current.tabs.clear()
-        self.tabs.current.tabs.append(Tab(text=tr("main_info").capitalize()))
+        self.tabs.current.tabs.append(Tab(text=tr_cap("main_info")))
         self.tab_info = [self.main_info]
         if self.mod.screenshots:
-            self.tabs.current.tabs.append(Tab(text=tr("screenshots").capitalize()))
+            self.tabs.current.tabs.append(Tab(text=tr_cap("screenshots")))
             self.tab_info.append(self.screenshots_container)
         if self.mod.change_log_content:
-            self.tabs.current.tabs.append(Tab(text=tr("change_log").capitalize()))
+            self.tabs.current.tabs.append(Tab(text=tr_cap("change_log")))
             self.tab_info.append(self.change_log)
         if self.mod.other_info_content:
-            self.tabs.current.tabs.append(Tab(text=tr("other_info").capitalize()))
+            self.tabs.current.tabs.append(Tab(text=tr_cap("other_info")))
             self.tab_info.append(self.other_info)
 
         self.tabs.current.update()
@@ -1884,7 +1978,7 @@ class ModInfo(ft.Container):
                                             ft.Row([
                                                 Column([
                                                 ft.Container(
-                                                    Row([Text(f'{tr("language").capitalize()}:'),
+                                                    Row([Text(f'{tr_cap("language")}:'),
                                                          Row([], ref=self.flag_buttons, spacing=0,
                                                              wrap=True, run_spacing=0)],
                                                              spacing=5,
@@ -1892,14 +1986,14 @@ class ModInfo(ft.Container):
                                                     padding=ft.padding.only(left=10)),
                                                 ft.Container(
                                                     ft.Row([
-                                                        Text(f"{tr('game').capitalize()}:  "),
+                                                        Text(f"{tr_cap('game')}:  "),
                                                         Text(tr(self.mod.installment))
                                                     ], spacing=5),
                                                     visible=bool(self.mod.release_date),
                                                     margin=ft.margin.only(left=10, top=3, bottom=10)),
                                                 ft.Container(
                                                     ft.Row([
-                                                        Text(f"{tr('release').capitalize()}:  "),
+                                                        Text(f"{tr_cap('release')}:  "),
                                                         Text(self.mod.release_date,
                                                              ref=self.release_date)
                                                     ], spacing=5),
@@ -1934,7 +2028,7 @@ class ModInfo(ft.Container):
                                                              color=ft.colors.PRIMARY, size=17),
                                                      padding=ft.padding.only(top=2)),
                                                  ft.Container(
-                                                     Row([ft.Text(tr("trailer_watch").capitalize(),
+                                                     Row([ft.Text(tr_cap("trailer_watch"),
                                                                   size=14)],
                                                          alignment=ft.MainAxisAlignment.CENTER),
                                                      margin=ft.margin.only(bottom=2))
@@ -1950,11 +2044,11 @@ class ModInfo(ft.Container):
                                                     elevation=3,
                                                     icon=ft.icons.DELETE_FOREVER_ROUNDED,
                                                     icon_color=ft.colors.ERROR,
-                                                    text=tr("delete_mod_short").capitalize(),
+                                                    text=tr_cap("delete_mod_short"),
                                                     color=ft.colors.ERROR,
                                                     ref=self.mod_delete_btn,
                                                     on_click=self.delete_mod_ask,
-                                                    tooltip=tr("delete_mod_from_library").capitalize())],
+                                                    tooltip=tr_cap("delete_mod_from_library"))],
                                                 alignment=ft.MainAxisAlignment.CENTER),
                                                 margin=7, padding=ft.padding.only(left=3))
                                             ],
@@ -2166,7 +2260,7 @@ class ModInfo(ft.Container):
 
     async def delete_mod_ask(self, e: ft.ControlEvent) -> None:
         await self.app.show_modal(tr("this_will_delete_mod"),
-                                  tr("ask_confirm_deletion").capitalize(),
+                                  tr_cap("ask_confirm_deletion"),
                                   on_yes=self.delete_mod_runner)
 
     async def delete_mod_runner(self, e: ft.ControlEvent) -> None:
@@ -2310,7 +2404,7 @@ class ModInfo(ft.Container):
                            tooltip=tr("incompatible_game_installment"))
 
             if self.app.game.installment is None:
-                game_label = tr("no_game_selected").capitalize()
+                game_label = tr_cap("no_game_selected")
                 has_game = False
             else:
                 game_label = tr(self.app.game.installment)
@@ -2376,7 +2470,7 @@ class ModInfo(ft.Container):
                                tooltip=tr("requirements_not_met"))
 
             if versions:
-                version_string = f'({tr("of_version").capitalize()}: {versions})'
+                version_string = f'({tr_cap("of_version")}: {versions})'
             else:
                 version_string = f'({tr("of_any_version")})'
 
@@ -2395,7 +2489,7 @@ class ModInfo(ft.Container):
                               tooltip="\n".join(req_errors),
                               color=ft.colors.ERROR)
                          ], spacing=5),
-                    Text(f'{tr("including_options").capitalize()}: {optional_cont}',
+                    Text(f'{tr_cap("including_options")}: {optional_cont}',
                          visible=bool(optional_cont),
                          weight=ft.FontWeight.W_300,
                          no_wrap=False)
@@ -2447,7 +2541,7 @@ class ModInfo(ft.Container):
             if not versions:
                 version_string = f'({tr("of_any_version")})'
             else:
-                version_string = f'({tr("of_version").capitalize()}: {versions})'
+                version_string = f'({tr_cap("of_version")}: {versions})'
 
             incomp_list.append(Row([
                 icon,
@@ -2470,7 +2564,7 @@ class ModInfo(ft.Container):
                               size=20,
                               tooltip="\n".join(incomp_errors),
                               color=ft.colors.ERROR)], spacing=5),
-                    Text(f'{tr("with_options").capitalize()}: {optional_cont}',
+                    Text(f'{tr_cap("with_options")}: {optional_cont}',
                          visible=bool(optional_cont),
                          weight=ft.FontWeight.W_300,
                          no_wrap=False),
@@ -2513,7 +2607,7 @@ class ModInfo(ft.Container):
                               weight=ft.FontWeight.W_300),
                          Text(f'[{self.mod.existing_version.get("build")}]',
                               weight=ft.FontWeight.W_300),
-                         Text((f'{tr("language").capitalize()}: '
+                         Text((f'{tr_cap("language")}: '
                                f'{lang_name}'),
                               weight=ft.FontWeight.W_300)], spacing=5),
                     Row([Text(reinstall_warning,
@@ -2523,20 +2617,20 @@ class ModInfo(ft.Container):
                         ], expand=True)
                      ]
         if installment_compat_content:
-            point_list.append(Text(tr("game_compatibility").capitalize() + ":",
+            point_list.append(Text(tr_cap("game_compatibility") + ":",
                               weight=ft.FontWeight.BOLD))
             point_list.append(Row(controls=installment_compat_content))
         else:
             if req_list:
-                point_list.append(Text(tr("required_base").capitalize() + ":",
+                point_list.append(Text(tr_cap("required_base") + ":",
                                   weight=ft.FontWeight.BOLD))
                 point_list.extend(req_list)
             if incomp_list:
-                point_list.append(Text(tr("incompatible_base").capitalize() + ":",
+                point_list.append(Text(tr_cap("incompatible_base") + ":",
                                   weight=ft.FontWeight.BOLD))
                 point_list.extend(incomp_list)
             if reinstall_content:
-                point_list.append(Text(tr("check_reinstallability").capitalize() + ":",
+                point_list.append(Text(tr_cap("check_reinstallability") + ":",
                                   weight=ft.FontWeight.BOLD))
                 point_list.append(Row(controls=reinstall_content))
 
@@ -2589,7 +2683,7 @@ class ModArchiveItem(ft.Card):
         self.extracting = True
         loading_text = await self.app.show_loading(
             f"{self.mod.display_name} {self.mod.version!r} [{self.mod.build}]",
-            tr("unpacking").capitalize())
+            tr_cap("unpacking"))
         self.progress_ring.current.visible = True
         self.file_counting_text.current.visible = True
         self.version_label.current.visible = False
@@ -2606,13 +2700,13 @@ class ModArchiveItem(ft.Card):
     async def toggle_archived_info(self, e: ft.ControlEvent) -> None:
         self.expanded = not self.expanded
         if self.expanded:
-            self.about_archived_mod.current.text = tr("hide_menu").capitalize()
+            self.about_archived_mod.current.text = tr_cap("hide_menu")
             self.about_info.current.height = None
             self.about_info.current.update()
             self.mods_screen.mods_list_view.current.scroll_to(
                 key=self.mod.id_str, duration=500)
         else:
-            self.about_archived_mod.current.text = tr("about_mod").capitalize()
+            self.about_archived_mod.current.text = tr_cap("about_mod")
             self.about_info.current.height = 0
             self.about_info.current.update()
         self.about_archived_mod.current.update()
@@ -2631,7 +2725,7 @@ class ModArchiveItem(ft.Card):
                                          no_wrap=True,
                                          size=18,
                                          weight=ft.FontWeight.W_500,
-                                         tooltip=tr("mod_version_and_build").capitalize(),
+                                         tooltip=tr_cap("mod_version_and_build"),
                                          color=ft.colors.ON_PRIMARY_CONTAINER,
                                          overflow=ft.TextOverflow.ELLIPSIS),
                                     margin=ft.margin.only(bottom=3),
@@ -2674,7 +2768,7 @@ class ModArchiveItem(ft.Card):
                         Column([
                             Row([
                                  ft.Container(ft.ElevatedButton(
-                                    tr("extract").capitalize(),
+                                    tr_cap("extract"),
                                     icon=ft.icons.UNARCHIVE_ROUNDED,
                                     ref=self.extract_btn,
                                     disabled=self.extracting,
@@ -2690,12 +2784,12 @@ class ModArchiveItem(ft.Card):
                                             ft.MaterialState.DISABLED: ft.colors.SURFACE_VARIANT
                                         }
                                     ),
-                                    tooltip=tr("extract_mod").capitalize(),
+                                    tooltip=tr_cap("extract_mod"),
                                     on_click=self.extract), alignment=ft.alignment.center)
                                  ],
                                 alignment=ft.MainAxisAlignment.CENTER,
                                 vertical_alignment=ft.CrossAxisAlignment.CENTER, wrap=True),
-                            ft.OutlinedButton(tr("about_mod").capitalize(),
+                            ft.OutlinedButton(tr_cap("about_mod"),
                                               animate_size=ft.animation.Animation(
                                                 66, ft.AnimationCurve.EASE_IN),
                                               ref=self.about_archived_mod,
@@ -2704,10 +2798,10 @@ class ModArchiveItem(ft.Card):
                         ], spacing=10, columns=26, vertical_alignment=ft.CrossAxisAlignment.CENTER),
                     ft.Container(
                         ft.Row([ft.Container(ft.Column([
-                            Text(f"{tr('game').capitalize()}: {tr(self.mod.installment)}",
+                            Text(f"{tr_cap('game')}: {tr(self.mod.installment)}",
                                  color=ft.colors.SECONDARY,
                                  weight=ft.FontWeight.W_500),
-                            Text(tr("main_info").capitalize()),
+                            Text(tr_cap("main_info")),
                             Text(self.mod.description,
                                  no_wrap=False)]),
                             bgcolor=ft.colors.SURFACE,
@@ -2775,12 +2869,17 @@ class ModFamily(ft.AnimatedSwitcher):
     def mod(self) -> Mod:
         if self._current_mod is not None:
             return self._current_mod
-        self._main_mods.sort(key=lambda item: item.id_str.lower(), reverse=True)
+        self._main_mods.sort(key=operator.attrgetter("id_str_lower"), reverse=True)
         self._current_main_mod = self._main_mods[0]
         self._current_mod = self._main_mods[0]
         self.key = self._current_main_mod.id_str
         return self._current_mod
 
+    @property
+    def main_mod_ids(self) -> set[str]:
+        """Ids of all main mods in family, which are the ids mods are loaded with in session."""
+        return {mod.id_str for mod in self._main_mods}
+
     @property
     def variant(self) -> str:
         return self.current_mod.name
@@ -2818,7 +2917,7 @@ class ModFamily(ft.AnimatedSwitcher):
                 ft.MenuBar(controls=[ft.SubmenuButton(
                     expand=True,
                     content=Text(mod_atom.display_name,
-                                 tooltip=tr("mod_variant_name").capitalize(),
+                                 tooltip=tr_cap("mod_variant_name"),
                                  weight=ft.FontWeight.W_700,
                                  no_wrap=False,
                                  max_lines=2,
@@ -2897,7 +2996,7 @@ class ModFamily(ft.AnimatedSwitcher):
                 ft.MenuBar(controls=[ft.SubmenuButton(
                     expand=True,
                     content=Text(mod_atom.build_ver,
-                                 tooltip=tr("mod_version_and_build").capitalize(),
+                                 tooltip=tr_cap("mod_version_and_build"),
                                  no_wrap=True,
                                  weight=ft.FontWeight.W_400,
                                  data=mod_atom,
@@ -2917,7 +3016,7 @@ class ModFamily(ft.AnimatedSwitcher):
 
             return Row([
                 ft.Container(ft.PopupMenuButton(
-                    tooltip=tr("mod_version_and_build").capitalize(),
+                    tooltip=tr_cap("mod_version_and_build"),
                     content=ft.Container(
                         Row([
                             Text(mod_atom.build_ver,
@@ -2937,7 +3036,7 @@ class ModFamily(ft.AnimatedSwitcher):
         return Text(
             mod_atom.build_ver,
             no_wrap=True,
-            tooltip=tr("mod_version_and_build").capitalize(),
+            tooltip=tr_cap("mod_version_and_build"),
             color=name_color,
             overflow=ft.TextOverflow.ELLIPSIS)
 
@@ -3043,13 +3142,13 @@ class ModItem(ft.Card):
             self.app.page.update()
 
     async def toggle_info(self, e: ft.ControlEvent) -> None:
-        if self.about_mod_btn.current.text == tr("about_mod").capitalize():
-            self.about_mod_btn.current.text = tr("hide_menu").capitalize()
+        if self.about_mod_btn.current.text == tr_cap("about_mod"):
+            self.about_mod_btn.current.text = tr_cap("hide_menu")
             await self.info_container.current.toggle()
             self.app.local_mods.mods_list_view.current.scroll_to(
                 key=self.main_mod.id_str, duration=500)
         else:
-            self.about_mod_btn.current.text = tr("about_mod").capitalize()
+            self.about_mod_btn.current.text = tr_cap("about_mod")
             await self.info_container.current.toggle()
         # self.about_mod_btn.current.update()
         self.update()
@@ -3109,7 +3208,7 @@ class ModItem(ft.Card):
         if self.app.local_mods.game_is_running:
             install_tooltip = tr("game_is_running")
         elif not self.app.game.target_exe:
-            install_tooltip = tr("no_game_selected").capitalize()
+            install_tooltip = tr_cap("no_game_selected")
         elif not self.mod.installment_compatible:
             install_tooltip = tr("incompatible_game_installment")
         elif self.mod.is_reinstall:
@@ -3129,9 +3228,9 @@ class ModItem(ft.Card):
         btn.icon = ft.icons.CHECK_ROUNDED if self.mod.is_reinstall else None
 
         if not self.mod.is_reinstall:
-            btn.text = tr("install").capitalize()
+            btn.text = tr_cap("install")
         else:
-            btn.text = tr("installed").capitalize()
+            btn.text = tr_cap("installed")
 
         btn.style = ft.ButtonStyle(
             color={
@@ -3157,7 +3256,7 @@ class ModItem(ft.Card):
            and not self.app.local_mods.game_is_running and self.app.game.target_exe):
             btn.color = ft.colors.ON_ERROR
             btn.bgcolor = ft.colors.ERROR
-            btn.tooltip = tr("compat_checks_disabled").capitalize()
+            btn.tooltip = tr_cap("compat_checks_disabled")
             btn.disabled = False
 
         btn.update()
@@ -3230,8 +3329,8 @@ class ModItem(ft.Card):
                                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
                                 wrap=True)]),
                             ft.ElevatedButton(
-                                tr("install").capitalize() if not self.mod.is_reinstall
-                                else tr("installed").capitalize(),
+                                tr_cap("install") if not self.mod.is_reinstall
+                                else tr_cap("installed"),
                                 icon=ft.icons.CHECK_ROUNDED if self.mod.is_reinstall else None,
                                 style=ft.ButtonStyle(
                                   color={
@@ -3255,7 +3354,7 @@ class ModItem(ft.Card):
                                 disabled=mod_cant_install or self.app.local_mods.game_is_running,
                                 tooltip=self.get_install_btn_tooltip(),
                                 on_click=self.install_mod),
-                            ft.OutlinedButton(tr("about_mod").capitalize(),
+                            ft.OutlinedButton(tr_cap("about_mod"),
                                               animate_size=ft.animation.Animation(
                                                 66, ft.AnimationCurve.EASE_IN),
                                               ref=self.about_mod_btn,
@@ -3270,7 +3369,7 @@ class ModItem(ft.Card):
             self.install_btn.current.bgcolor = ft.colors.ERROR
             self.install_btn.current.color = ft.colors.ON_ERROR
             self.install_btn.current.disabled = False
-            self.install_btn.current.tooltip = tr("compat_checks_disabled").capitalize()
+            self.install_btn.current.tooltip = tr_cap("compat_checks_disabled")
 
 
 class ModInstallWizard(ft.Container):
@@ -3315,10 +3414,14 @@ class ModInstallWizard(ft.Container):
         self.install_details_number_text = ft.Ref[Text]()
         self.install_progress_bar = ft.Ref[ft.ProgressBar]()
 
+        self.welcome_capsule = ft.Ref[ft.Container]()
+        self.setting_up_capsule = ft.Ref[ft.Container]()
+        self.installing_capsule = ft.Ref[ft.Container]()
+        self.results_capsule = ft.Ref[ft.Container]()
         self.status_capsules = Row([])
         self.status_capsules_container = ft.Container(
             Column([
-                ft.Container(Text(tr("install_steps").capitalize(), weight=ft.FontWeight.BOLD),
+                ft.Container(Text(tr_cap("install_steps"), weight=ft.FontWeight.BOLD),
                              padding=ft.padding.symmetric(horizontal=5)),
                 self.status_capsules
                 ]), padding=ft.padding.symmetric(horizontal=40)
@@ -3335,6 +3438,39 @@ class ModInstallWizard(ft.Container):
         SETTING_UP = 2
         RESULTS = 3
 
+    # capsule colors indexed by (current step, step represented by capsule)
+    CAPSULE_COLORS: ClassVar[Mapping[tuple[Steps, Steps], tuple[str, str]]] = {
+        (Steps.WELCOME, Steps.WELCOME): _CAPSULE_ACTIVE,
+        (Steps.WELCOME, Steps.SETTING_UP): _CAPSULE_UNREACHABLE,
+        (Steps.WELCOME, Steps.INSTALLING): _CAPSULE_UNREACHABLE,
+        (Steps.WELCOME, Steps.RESULTS): _CAPSULE_UNREACHABLE,
+        (Steps.SETTING_UP, Steps.WELCOME): _CAPSULE_PASSED,
+        (Steps.SETTING_UP, Steps.SETTING_UP): _CAPSULE_ACTIVE,
+        (Steps.SETTING_UP, Steps.INSTALLING): _CAPSULE_UNREACHABLE,
+        (Steps.SETTING_UP, Steps.RESULTS): _CAPSULE_UNREACHABLE,
+        (Steps.INSTALLING, Steps.WELCOME): _CAPSULE_PASSED,
+        (Steps.INSTALLING, Steps.SETTING_UP): _CAPSULE_PASSED,
+        (Steps.INSTALLING, Steps.INSTALLING): _CAPSULE_ACTIVE,
+        (Steps.INSTALLING, Steps.RESULTS): _CAPSULE_UNREACHABLE,
+        (Steps.RESULTS, Steps.WELCOME): _CAPSULE_PASSED,
+        (Steps.RESULTS, Steps.SETTING_UP): _CAPSULE_PASSED,
+        (Steps.RESULTS, Steps.INSTALLING): _CAPSULE_PASSED,
+        (Steps.RESULTS, Steps.RESULTS): _CAPSULE_ACTIVE,
+    }
+
+    # style of confirmation buttons, shared between wizard screens
+    _YES_BUTTON_STYLE = ft.ButtonStyle(
+        color={
+            ft.MaterialState.HOVERED: ft.colors.ON_SECONDARY,
+            ft.MaterialState.DEFAULT: ft.colors.ON_PRIMARY,
+            ft.MaterialState.DISABLED: ft.colors.ON_SURFACE_VARIANT
+            },
+        bgcolor={
+            ft.MaterialState.HOVERED: ft.colors.SECONDARY,
+            ft.MaterialState.DEFAULT: ft.colors.PRIMARY,
+            ft.MaterialState.DISABLED: ft.colors.SURFACE_VARIANT
+        })
+
     class ModOption(ft.Card):
         def __init__(self, wizard: "ModInstallWizard", option: OptionalContent,
                      existing_content: str = "", **kwargs):
@@ -3715,27 +3851,27 @@ class ModInstallWizard(ft.Container):
                             Text(self.option.display_name,
                                  weight=ft.FontWeight.BOLD),
                             Text(f"[{self.option.name}]", opacity=0.6),
-                            Text(tr("will_not_be_installed").capitalize(),
+                            Text(tr_cap("will_not_be_installed"),
                                  color=ft.colors.TERTIARY,
                                  visible=not self.active and self.existing_content in ("skip", ""),
                                  ref=self.warning_text,
                                  weight=ft.FontWeight.W_500),
-                            Text(tr("cant_change_choice").capitalize(),
+                            Text(tr_cap("cant_change_choice"),
                                  color=ft.colors.ERROR,
                                  visible=bool(self.existing_content)
                                  and self.existing_content != "skip",
                                  opacity=0.85)
-                            ], wrap=True, run_spacing=5, col={"xs": 12, "xl": 11, "xxl": 10},
+                            ], wrap=True, run_spacing=5, col=_COL_LIBRARY,
                             alignment=ft.MainAxisAlignment.START),
                         Column([
                             Text(self.option.description, no_wrap=False),
-                            Text(f'{tr("choose_one_of_the_options").capitalize()}:',
+                            Text(f'{tr_cap("choose_one_of_the_options")}:',
                                  color=ft.colors.SECONDARY),
                             *selector,
-                            ], spacing=5, col={"xs": 12, "xl": 11, "xxl": 10},
+                            ], spacing=5, col=_COL_LIBRARY,
                             alignment=ft.MainAxisAlignment.START),
                         Column([self.get_screenshots_container()],
-                            col={"xs": 12, "xl": 11, "xxl": 10})
+                            col=_COL_LIBRARY)
                     ], alignment=ft.MainAxisAlignment.CENTER),
                     margin=ft.margin.only(left=20, right=15, top=15, bottom=10),
                     alignment=ft.alignment.center
@@ -3748,28 +3884,28 @@ class ModInstallWizard(ft.Container):
                             Text(self.option.display_name,
                                  weight=ft.FontWeight.BOLD),
                             Text(f"[{self.option.name}]", opacity=0.6),
-                            Text(tr("will_not_be_installed").capitalize(),
+                            Text(tr_cap("will_not_be_installed"),
                                  color=ft.colors.TERTIARY,
                                  visible=not self.active and self.existing_content != "yes",
                                  ref=self.warning_text,
                                  weight=ft.FontWeight.W_500),
-                            Text(tr("cant_change_choice").capitalize(),
+                            Text(tr_cap("cant_change_choice"),
                                  color=ft.colors.ERROR,
                                  visible=bool(self.existing_content) and not self.option.forced_option
                                  and self.existing_content != "skip",
                                  opacity=0.85),
-                            Text(tr("forced_option").capitalize(),
+                            Text(tr_cap("forced_option"),
                                  color=ft.colors.TERTIARY,
                                  visible=self.option.forced_option,
                                  opacity=0.85)
-                            ], wrap=True, run_spacing=5, col={"xs": 12, "xl": 11, "xxl": 10},
+                            ], wrap=True, run_spacing=5, col=_COL_LIBRARY,
                             alignment=ft.MainAxisAlignment.START),
                         Row([
                             Text(self.option.description, no_wrap=False, expand=True)
-                            ], col={"xs": 12, "xl": 11, "xxl": 10},
+                            ], col=_COL_LIBRARY,
                             alignment=ft.MainAxisAlignment.START),
                         Column([self.get_screenshots_container()],
-                            col={"xs": 12, "xl": 11, "xxl": 10})
+                            col=_COL_LIBRARY)
                     ], alignment=ft.MainAxisAlignment.CENTER),
                     margin=ft.margin.only(left=20, right=15, top=15, bottom=15),
                     alignment=ft.alignment.center
@@ -3817,7 +3953,7 @@ class ModInstallWizard(ft.Container):
         now_time = datetime.now()
         if (now_time - self.callback_time).microseconds > CALLBACK_TIMEOUT:
             file_counting_text = f"{file_num} {tr('one_of_many')} {files_count}"
-            description = f"{tr('copying_file').capitalize()}: {file_name} - {file_size} KB"
+            description = f"{tr_cap('copying_file')}: {file_name} - {file_size} KB"
             self.install_details_number_text.current.value = file_counting_text
             self.install_details_text.current.value = description
             self.install_details_number_text.current.update()
@@ -3844,13 +3980,13 @@ class ModInstallWizard(ft.Container):
         is_comrem_or_patch = is_comrem or is_compatch
 
         self.screen.current.content = ft.Column([
-            Text(f"{tr('install_in_progress').capitalize()}...",
+            Text(f"{tr_cap('install_in_progress')}...",
                  theme_style=ft.TextThemeStyle.HEADLINE_SMALL),
             ft.ResponsiveRow([
                 Image(src=mod.banner_path,
                       visible=mod.banner_path is not None,
                       fit=ft.ImageFit.CONTAIN,
-                      col={"xs": 12, "xl": 11, "xxl": 10})
+                      col=_COL_LIBRARY)
                 ], alignment=ft.MainAxisAlignment.CENTER),
             ft.ProgressRing(width=100, height=100),
             ft.ResponsiveRow([Text(ref=self.install_details_number_text,
@@ -4015,13 +4151,13 @@ class ModInstallWizard(ft.Container):
 
         if status_ok:
             info_color = ft.colors.TERTIARY
-            result_text = Text(tr("successfully").capitalize(),
+            result_text = Text(tr_cap("successfully"),
                                color=info_color,
                                weight=ft.FontWeight.BOLD)
             debug_info = ""
         else:
             info_color = ft.colors.ERROR
-            result_text = Text(tr("error_occurred").capitalize(),
+            result_text = Text(tr_cap("error_occurred"),
                                color=info_color,
                                weight=ft.FontWeight.BOLD)
             debug_info = ("**Debug info**\n"
@@ -4068,9 +4204,9 @@ class ModInstallWizard(ft.Container):
 
         with_opt_label = ""
         if options_installed and status_ok:
-            with_opt_label = tr("with_option").capitalize()
+            with_opt_label = tr_cap("with_option")
             if len(options_installed) > 1:
-                with_opt_label = tr("with_options").capitalize()
+                with_opt_label = tr_cap("with_options")
 
             mod_info.append(
                 ExpandableContainer(with_opt_label,
@@ -4090,7 +4226,7 @@ class ModInstallWizard(ft.Container):
             ]))
 
         if changes_description:
-            mod_info.append(Text(f'{tr("binary_fixes").capitalize()}:'))
+            mod_info.append(Text(f'{tr_cap("binary_fixes")}:'))
             for change_desc in changes_description:
                 change = tr(change_desc)
                 for splited_raw in change.split("\n"):
@@ -4105,7 +4241,7 @@ class ModInstallWizard(ft.Container):
 
         reinstall_warn_container = ft.Container(Row([
             Icon(ft.icons.WARNING_OUTLINED, color=ft.colors.ERROR),
-            Text((f'{tr("was_reinstall").capitalize()}!\n'
+            Text((f'{tr_cap("was_reinstall")}!\n'
                   f'{tr("install_from_scratch_if_issues")}'),
                  no_wrap=False, color=ft.colors.ERROR, expand=True),
             ]),
@@ -4130,7 +4266,7 @@ class ModInstallWizard(ft.Container):
                         Icon(ft.icons.CHECK_CIRCLE_ROUNDED if status_ok else ft.icons.WARNING_ROUNDED,
                              size=80,
                              color=info_color),
-                        Text(tr("installed").capitalize() if status_ok else tr("not_installed").capitalize(),
+                        Text(tr_cap("installed") if status_ok else tr_cap("not_installed"),
                              color=ft.colors.TERTIARY if status_ok else ft.colors.ERROR,
                              weight=ft.FontWeight.W_600)],
                            horizontal_alignment=ft.CrossAxisAlignment.CENTER, expand=2),
@@ -4154,7 +4290,7 @@ class ModInstallWizard(ft.Container):
         close_window_btn = ft.Ref[ft.FilledTonalButton]()
 
         self.screen.current.content = ft.Column([
-            ft.Text(tr("install_results").capitalize(),
+            ft.Text(tr_cap("install_results"),
                     theme_style=ft.TextThemeStyle.HEADLINE_SMALL),
             mod_status_and_description,
             Column(controls=mod_info, height=0,
@@ -4162,7 +4298,7 @@ class ModInstallWizard(ft.Container):
                    animate_size=ft.animation.Animation(500, ft.AnimationCurve.DECELERATE)),
             ft.Divider(),
             reinstall_warn_container,
-            ft.FilledTonalButton(tr("close_window").capitalize(),
+            ft.FilledTonalButton(tr_cap("close_window"),
                                  data="close",
                                  ref=close_window_btn,
                                  height=0,
@@ -4191,7 +4327,7 @@ class ModInstallWizard(ft.Container):
         self.close_wizard_btn.current.selected = False
         # self.close_wizard_btn.current.update()
 
-        self.close_wizard_btn_tooltip.current.message = tr("close_window").capitalize()
+        self.close_wizard_btn_tooltip.current.message = tr_cap("close_window")
         # self.close_wizard_btn_tooltip.current.update()
         self.update()
 
@@ -4233,7 +4369,7 @@ class ModInstallWizard(ft.Container):
     async def change_from_default(self) -> None:
         self.default_install_btn.current.content = Row([
             Icon(ft.icons.STAR, color=ft.colors.ON_PRIMARY, size=22),
-            Text(tr("choose_recommended_install").capitalize())
+            Text(tr_cap("choose_recommended_install"))
         ], alignment=ft.MainAxisAlignment.CENTER)
         self.default_install_btn.current.disabled = False
 
@@ -4287,7 +4423,7 @@ class ModInstallWizard(ft.Container):
 
         self.default_install_btn.current.content = ft.Row([
                     Icon(ft.icons.RECOMMEND_ROUNDED, color=ft.colors.TERTIARY),
-                    Text(tr("recommended_install_chosen").capitalize())
+                    Text(tr_cap("recommended_install_chosen"))
         ], alignment=ft.MainAxisAlignment.CENTER)
         self.default_install_btn.current.disabled = True
 
@@ -4387,7 +4523,7 @@ class ModInstallWizard(ft.Container):
                 self.variant_buttons[srv_name].disabled = False
                 self.variant_buttons[srv_name].bgcolor = ft.colors.ERROR
                 self.variant_buttons[srv_name].foreground_color = ft.colors.ON_ERROR
-                self.variant_buttons[srv_name].tooltip = tr("compat_checks_disabled").capitalize()
+                self.variant_buttons[srv_name].tooltip = tr_cap("compat_checks_disabled")
 
         if variant_used.optional_content:
             self.can_have_custom_install = True
@@ -4407,22 +4543,12 @@ class ModInstallWizard(ft.Container):
             reinstall_warning += "\n" + tr("install_from_scratch_if_issues")
 
         user_answer_buttons = [
-            ft.ElevatedButton(tr("yes").capitalize(),
+            ft.ElevatedButton(tr_cap("yes"),
                               width=100,
                               on_click=self.agree_to_install,
                               data={"variant_name": variant_name},
-                              style=ft.ButtonStyle(
-                                 color={
-                                     ft.MaterialState.HOVERED: ft.colors.ON_SECONDARY,
-                                     ft.MaterialState.DEFAULT: ft.colors.ON_PRIMARY,
-                                     ft.MaterialState.DISABLED: ft.colors.ON_SURFACE_VARIANT
-                                     },
-                                 bgcolor={
-                                     ft.MaterialState.HOVERED: ft.colors.SECONDARY,
-                                     ft.MaterialState.DEFAULT: ft.colors.PRIMARY,
-                                     ft.MaterialState.DISABLED: ft.colors.SURFACE_VARIANT
-                                 })),
-            ft.FilledTonalButton(tr("no").capitalize(),
+                              style=self._YES_BUTTON_STYLE),
+            ft.FilledTonalButton(tr_cap("no"),
                                  width=100,
                                  on_click=self.close_wizard)
             ]
@@ -4436,44 +4562,51 @@ class ModInstallWizard(ft.Container):
 
         flag_btns = self.get_flag_buttons() if self.current_variant.translations else []
 
+        # skip invisible widgets entirely, so they are not sent to the client
+        banner = []
+        if variant_used.banner_path is not None:
+            banner.append(Image(src=variant_used.banner_path,
+                                fit=ft.ImageFit.CONTAIN,
+                                col=_COL_LIBRARY))
+
+        reinstall_warning_row = []
+        if reinstall_warning:
+            reinstall_warning_row.append(
+                ft.Row([ft.Container(Row([
+                        Icon(ft.icons.WARNING_OUTLINED, color=ft.colors.ERROR),
+                        Column([
+                            Text(tr_cap("check_reinstallability"), weight=ft.FontWeight.BOLD,
+                                 color=ft.colors.ERROR),
+                            Text(reinstall_warning, no_wrap=False, color=ft.colors.ERROR)], spacing=5),
+                        ], spacing=30, alignment=ft.MainAxisAlignment.CENTER),
+                        border_radius=10,
+                        padding=ft.padding.only(top=15, bottom=15, left=30, right=60),
+                        margin=ft.margin.only(bottom=10),
+                        bgcolor=ft.colors.ERROR_CONTAINER)], alignment=ft.MainAxisAlignment.CENTER, tight=True))
+
         self.screen.current.content = ft.Column([
-            ft.ResponsiveRow([
-                Image(src=variant_used.banner_path,
-                      visible=variant_used.banner_path is not None,
-                      fit=ft.ImageFit.CONTAIN,
-                      col={"xs": 12, "xl": 11, "xxl": 10})
-                ], alignment=ft.MainAxisAlignment.CENTER),
+            ft.ResponsiveRow(banner, alignment=ft.MainAxisAlignment.CENTER),
             ft.ResponsiveRow([
                 ft.Container(Column([
                     Text(description, no_wrap=False),
-                    Text(f"{tr('choose_one_of_the_options').capitalize()}:",
+                    Text(f"{tr_cap('choose_one_of_the_options')}:",
                          visible=bool(self.main_mod.variants)),
                     ft.Row(list(self.variant_buttons.values()), #, patch_button],
                            visible=bool(self.main_mod.variants), # cleaner than to check for len of loaded
                            alignment=ft.MainAxisAlignment.CENTER, wrap=True),
                     ], horizontal_alignment=ft.CrossAxisAlignment.CENTER), padding=ft.padding.only(bottom=5),
-                             col={"xs": 12, "xl": 11, "xxl": 10})
+                             col=_COL_LIBRARY)
                 ], alignment=ft.MainAxisAlignment.CENTER),
-            ft.ResponsiveRow([ft.Container(ft.Divider(height=3), col={"xs": 12, "xl": 11, "xxl": 10})],
+            ft.ResponsiveRow([ft.Container(ft.Divider(height=3), col=_COL_LIBRARY)],
                              alignment=ft.MainAxisAlignment.CENTER),
             ft.Container(Column([
-                ft.Row([ft.Container(Row([
-                        Icon(ft.icons.WARNING_OUTLINED, color=ft.colors.ERROR),
-                        Column([
-                            Text(tr("check_reinstallability").capitalize(), weight=ft.FontWeight.BOLD,
-                                 color=ft.colors.ERROR),
-                            Text(reinstall_warning, no_wrap=False, color=ft.colors.ERROR)], spacing=5),
-                        ], spacing=30, alignment=ft.MainAxisAlignment.CENTER),
-                        visible=bool(reinstall_warning), border_radius=10,
-                        padding=ft.padding.only(top=15, bottom=15, left=30, right=60),
-                        margin=ft.margin.only(bottom=10),
-                        bgcolor=ft.colors.ERROR_CONTAINER)], alignment=ft.MainAxisAlignment.CENTER, tight=True),
+                *reinstall_warning_row,
                 ft.ResponsiveRow(flag_btns, visible=bool(self.current_variant.translations),
                                  ref=self.flag_buttons, alignment=ft.MainAxisAlignment.CENTER,
                                  columns=12 if len(flag_btns) <= 12 else len(flag_btns)),
                 Text(welcome_install_prompt,
                      text_align=ft.TextAlign.CENTER),
-                Text(f"({tr('mod_install_language').capitalize()}: {variant_used.lang_label})",
+                Text(f"({tr_cap('mod_install_language')}: {variant_used.lang_label})",
                      color=ft.colors.SECONDARY)
                 ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=5), padding=5),
             Row(controls=user_answer_buttons,
@@ -4502,11 +4635,10 @@ class ModInstallWizard(ft.Container):
             self.ok_button.current.disabled = False
             self.no_base_content_mod_warning.current.visible = False
         if update:
-            # if self.mod_var_lang.no_base_content:
-                # self.ok_button.current.update()
-                # self.no_base_content_mod_warning.current.update()
-            # self.install_ask.current.update()
-            self.update()
+            # single batched update of just the changed controls instead of the whole wizard
+            self.app.page.update(self.ok_button.current,
+                                 self.no_base_content_mod_warning.current,
+                                 self.install_ask.current)
 
     async def show_settings_screen(self, e: ft.ControlEvent | None = None) -> None:
         self.options.clear()
@@ -4524,23 +4656,13 @@ class ModInstallWizard(ft.Container):
             self.options.append(self.ModOption(self, option))
 
         user_choice_buttons = [
-            ft.ElevatedButton(tr("yes").capitalize(),
+            ft.ElevatedButton(tr_cap("yes"),
                               width=100,
                               on_click=self.show_install_progress,
-                              style=ft.ButtonStyle(
-                                 color={
-                                     ft.MaterialState.HOVERED: ft.colors.ON_SECONDARY,
-                                     ft.MaterialState.DEFAULT: ft.colors.ON_PRIMARY,
-                                     ft.MaterialState.DISABLED: ft.colors.ON_SURFACE_VARIANT
-                                     },
-                                 bgcolor={
-                                     ft.MaterialState.HOVERED: ft.colors.SECONDARY,
-                                     ft.MaterialState.DEFAULT: ft.colors.PRIMARY,
-                                     ft.MaterialState.DISABLED: ft.colors.SURFACE_VARIANT
-                                 }),
+                              style=self._YES_BUTTON_STYLE,
                               ref=self.ok_button,
                               ),
-            ft.FilledTonalButton(tr("no").capitalize(),
+            ft.FilledTonalButton(tr_cap("no"),
                                  width=100,
                                  on_click=self.close_wizard),
         ]
@@ -4557,9 +4679,9 @@ class ModInstallWizard(ft.Container):
                 Icon(ft.icons.RULE,
                      color=ft.colors.TERTIARY,
                      visible=forced_options),
-                Text(tr("recommended_install_chosen").capitalize(),
+                Text(tr_cap("recommended_install_chosen"),
                      visible=not forced_options),
-                Text(tr("last_settings_chosed").capitalize(),
+                Text(tr_cap("last_settings_chosed"),
                      visible=forced_options)
                 ], alignment=ft.MainAxisAlignment.CENTER),
                 clip_behavior=ft.ClipBehavior.HARD_EDGE),
@@ -4567,26 +4689,15 @@ class ModInstallWizard(ft.Container):
             on_click=self.set_to_default,
             disabled=True,
             visible=not self.requires_custom_install or mod.is_reinstall,
-            style=ft.ButtonStyle(
-                             side={
-                                 ft.MaterialState.DISABLED: ft.BorderSide(width=1,
-                                                                          color=ft.colors.TERTIARY)
-                             },
-                             color={
-                                 ft.MaterialState.DEFAULT: ft.colors.ON_PRIMARY,
-                                 ft.MaterialState.DISABLED: ft.colors.TERTIARY
-                                 },
-                             bgcolor={
-                                 ft.MaterialState.DEFAULT: ft.colors.PRIMARY,
-                                 ft.MaterialState.DISABLED: ft.colors.SURFACE_VARIANT
-                             }),
+            style=_DEFAULT_BTN_STYLE,
             ref=self.default_install_btn))
 
+        banner = []
+        if mod.banner_path is not None:
+            banner.append(Image(src=mod.banner_path, col={"xs": 5, "xl": 4, "xxl": 3}))
+
         self.screen.current.content = ft.Column([
-            ft.ResponsiveRow([
-                Image(src=mod.banner_path, visible=mod.banner_path is not None,
-                      col={"xs": 5, "xl": 4, "xxl": 3})
-                ], alignment=ft.MainAxisAlignment.CENTER),
+            ft.ResponsiveRow(banner, alignment=ft.MainAxisAlignment.CENTER),
             ft.ResponsiveRow([
                 ft.Container(Column([
                     Text(tr("default_options"), text_align=ft.TextAlign.CENTER,
@@ -4596,7 +4707,7 @@ class ModInstallWizard(ft.Container):
                            scroll=ft.ScrollMode.AUTO, spacing=5),
                     ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                     padding=ft.padding.only(top=5, bottom=10),
-                    col={"xs": 12, "xl": 11, "xxl": 10})
+                    col=_COL_LIBRARY)
                 ], alignment=ft.MainAxisAlignment.CENTER),
             ft.ResponsiveRow([ft.Container(ft.Divider(height=3),
                                            col={"xs": 10, "xl": 9, "xxl": 8})],
@@ -4646,104 +4757,25 @@ class ModInstallWizard(ft.Container):
     async def update_status_capsules(self, step: Steps) -> None:
         self.current_screen = step
 
-        # colors of capsule representing currently active installation step
-        active_clr = ft.colors.ON_PRIMARY_CONTAINER
-        active_cont = ft.colors.PRIMARY_CONTAINER
-
-        # colors of capsule representing step that can't be directly chosen by pressing the capsule
-        bg_clr = ft.colors.ON_SURFACE
-        bg_cont = ft.colors.SURFACE
-
-        # colors of capsule representing step that was already processed but we can go back to it
-        deflt_clr = ft.colors.ON_SECONDARY_CONTAINER
-        deflt_cont = ft.colors.SECONDARY_CONTAINER
+        installing_or_results = step in (self.Steps.INSTALLING, self.Steps.RESULTS)
+
+        capsules = {
+            self.Steps.WELCOME: self.welcome_capsule.current,
+            self.Steps.SETTING_UP: self.setting_up_capsule.current,
+            self.Steps.INSTALLING: self.installing_capsule.current,
+            self.Steps.RESULTS: self.results_capsule.current
+        }
+        for capsule_step, capsule in capsules.items():
+            text_color, container_color = self.CAPSULE_COLORS[step, capsule_step]
+            capsule.bgcolor = container_color
+            capsule.content.color = text_color
+            capsule.content.weight = ft.FontWeight.W_500 if capsule_step == step else ft.FontWeight.W_400
+            capsule.content.opacity = 0.5 if self.mod_var_lang is None else 1.0
+
+        self.welcome_capsule.current.disabled = installing_or_results
+        self.setting_up_capsule.current.disabled = installing_or_results
+        self.setting_up_capsule.current.visible = self.can_have_custom_install
 
-        welcome = step == self.Steps.WELCOME
-        setting_up = step == self.Steps.SETTING_UP
-        installing = step == self.Steps.INSTALLING
-        results = step == self.Steps.RESULTS
-
-        if welcome:
-            welcome_clr = active_clr
-            welcome_cont = active_cont
-        else:
-            welcome_clr = deflt_clr
-            welcome_cont = deflt_cont
-
-        if welcome:
-            setting_up_clr = bg_clr
-            setting_up_cont = bg_cont
-        elif setting_up:
-            setting_up_clr = active_clr
-            setting_up_cont = active_cont
-        else:
-            setting_up_clr = deflt_clr
-            setting_up_cont = deflt_cont
-
-        if welcome or setting_up:
-            installing_clr = bg_clr
-            installing_cont = bg_cont
-        elif installing:
-            installing_clr = active_clr
-            installing_cont = active_cont
-        else:
-            installing_clr = deflt_clr
-            installing_cont = deflt_cont
-
-        capsules = [
-                    ft.Container(
-                        Text(tr("welcoming").capitalize(),
-                             weight=ft.FontWeight.W_500 if welcome else ft.FontWeight.W_400,
-                             size=12,
-                             color=welcome_clr,
-                             opacity=0.5 if self.mod_var_lang is None else 1.0),
-                        bgcolor=welcome_cont,
-                        border_radius=10,
-                        padding=ft.padding.symmetric(horizontal=10, vertical=2),
-                        ink=True,
-                        expand=1,
-                        disabled=installing or results,
-                        on_click=self.show_welcome_mod_screen),
-                    ft.Container(
-                        Text(tr("setting_up").capitalize(),
-                             weight=ft.FontWeight.W_500 if setting_up else ft.FontWeight.W_400,
-                             size=12,
-                             color=setting_up_clr,
-                             opacity=0.5 if self.mod_var_lang is None else 1.0),
-                        bgcolor=setting_up_cont,
-                        border_radius=10,
-                        padding=ft.padding.symmetric(horizontal=10, vertical=2),
-                        ink=True,
-                        expand=1,
-                        visible=self.can_have_custom_install,
-                        disabled=installing or results),
-                    ft.Container(
-                        Text(tr("installation").capitalize(),
-                             weight=ft.FontWeight.W_500 if installing else ft.FontWeight.W_400,
-                             size=12,
-                             color=installing_clr,
-                             opacity=0.5 if self.mod_var_lang is None else 1.0),
-                        bgcolor=installing_cont,
-                        border_radius=10,
-                        padding=ft.padding.symmetric(horizontal=10, vertical=2),
-                        ink=True,
-                        expand=1,
-                        disabled=True),
-                    ft.Container(
-                        Text(tr("install_results").capitalize(),
-                             weight=ft.FontWeight.W_500 if results else ft.FontWeight.W_400,
-                             size=12,
-                             color=active_clr if results else bg_clr,
-                             opacity=0.5 if self.mod_var_lang is None else 1.0),
-                        bgcolor=active_cont if results else bg_cont,
-                        border_radius=10,
-                        padding=ft.padding.symmetric(horizontal=10, vertical=2),
-                        disabled=True,
-                        ink=True,
-                        expand=1)
-                    ]
-
-        self.status_capsules.controls = capsules
         self.status_capsules.update()
 
     async def switch_title(self, title: str) -> None:
@@ -4751,6 +4783,40 @@ class ModInstallWizard(ft.Container):
         self.mod_title.current.update()
 
     def build(self) -> None:
+        self.status_capsules.controls = [
+            ft.Container(
+                Text(tr_cap("welcoming"), size=12),
+                border_radius=10,
+                padding=_CAPSULE_PADDING,
+                ink=True,
+                expand=1,
+                on_click=self.show_welcome_mod_screen,
+                ref=self.welcome_capsule),
+            ft.Container(
+                Text(tr_cap("setting_up"), size=12),
+                border_radius=10,
+                padding=_CAPSULE_PADDING,
+                ink=True,
+                expand=1,
+                ref=self.setting_up_capsule),
+            ft.Container(
+                Text(tr_cap("installation"), size=12),
+                border_radius=10,
+                padding=_CAPSULE_PADDING,
+                ink=True,
+                expand=1,
+                disabled=True,
+                ref=self.installing_capsule),
+            ft.Container(
+                Text(tr_cap("install_results"), size=12),
+                border_radius=10,
+                padding=_CAPSULE_PADDING,
+                ink=True,
+                expand=1,
+                disabled=True,
+                ref=self.results_capsule)
+            ]
+
         self.content = Column([ft.ResponsiveRow([
             Column(controls=[
                 ft.Card(ft.Container(
@@ -4771,7 +4837,7 @@ class ModInstallWizard(ft.Container):
                                            on_click=self.app.maximize, icon_size=17,
                                            style=title_btn_style()),
                             ft.Tooltip(
-                                message=tr("cancel_install").capitalize(),
+                                message=tr_cap("cancel_install"),
                                 wait_duration=50,
                                 ref=self.close_wizard_btn_tooltip,
                                 content=ft.IconButton(ft.icons.CLOSE_ROUNDED,
@@ -4800,6 +4866,8 @@ class LocalModsScreen(Column):
         super().__init__(**kwargs)
         self.app = app
         self.tracked_loaded_mods = set()
+        # ids of mods in archived list view, kept in sync with its controls
+        self.tracked_archived_mods: set[str] = set()
         self.mods_list_view = ft.Ref[ft.ListView]()
         self.mods_archived_list_view = ft.Ref[ft.ListView]()
         self.add_mods_column = ft.Ref[Column]()
@@ -4807,6 +4875,11 @@ class LocalModsScreen(Column):
         self.no_mods_warning = ft.Ref[Text]()
         self.game_info = ft.Ref[ft.Container]()
         self.get_mod_archive_dialog = ft.FilePicker(on_result=self.load_mod_archive_result)
+        self.no_distro_placeholder: list[ft.Control] | None = None
+        # parts of game info card, reused while the game and its mods stay the same
+        self.mods_tooltip: ft.Tooltip | None = None
+        self.game_running_tooltip: ft.Tooltip | None = None
+        self.no_distro_placeholder_lang: str | None = None
         self.refreshing = False
         self.game_is_running = False
 
@@ -4838,37 +4911,39 @@ class LocalModsScreen(Column):
                 Row([
                     ft.ProgressRing(),
                     ft.Text(f'{mod.name} {mod.version!r} [{mod.build}]: '
-                            f'{tr("deleting_mod_from_lib").capitalize()}.')
+                            f'{tr_cap("deleting_mod_from_lib")}.')
                     ], tight=True),
                 padding=20, ref=cont_ref
             ),
             open=True,
         )
         self.app.page.overlay.append(bs)
+        # page update already sends the newly added overlay
         self.app.page.update()
-        bs.update()
         await aiofiles.os.remove(os.path.join(mod.manifest_root, "manifest.yaml"))
 
         mod_path = Path(mod.manifest_root)
+        parents = mod_path.parents
         main_distro = Path(self.app.context.distribution_dir, "mods")
 
         try:
-            if main_distro in mod_path.parents:
+            # main_distro being among parents guarantees that indexes up to its position are valid
+            if main_distro in parents:
                 # if mod dir is located directly in "mods" - delete just that
-                if mod_path.parent == main_distro:
+                if parents[0] == main_distro:
                     await aioshutil.rmtree(mod_path)
                 # mod directory is very often nested inside another dir because of zip files structure
                 # if we can detect that it's safe, we will delete whole nested structure
-                elif mod_path.parent.parent == main_distro:
+                elif parents[1] == main_distro:
                     # we only want to delete parent dir if it was automatically created by commod
-                    if mod_path.parent.stem == mod.id_str:
-                        await aioshutil.rmtree(mod_path.parent)
+                    if parents[0].stem == mod.id_str:
+                        await aioshutil.rmtree(parents[0])
                     else:
                         await aioshutil.rmtree(mod_path)
-                elif mod_path.parent.parent.parent == main_distro:
+                elif parents[2] == main_distro:
                     # same as above
-                    if mod_path.parent.parent.stem == mod.id_str:
-                        await aioshutil.rmtree(mod_path.parent.parent)
+                    if parents[1].stem == mod.id_str:
+                        await aioshutil.rmtree(parents[1])
                     else:
                         await aioshutil.rmtree(mod_path)
         except PermissionError:
@@ -4877,7 +4952,7 @@ class LocalModsScreen(Column):
         cont_ref.current.content = Row(
             [
                 Icon(ft.icons.CHECK_CIRCLE_ROUNDED, color=ft.colors.TERTIARY, size=37),
-                ft.Text(f'{tr("ready").capitalize()}: {mod.name} {mod.version!r} [{mod.build}] - '
+                ft.Text(f'{tr_cap("ready")}: {mod.name} {mod.version!r} [{mod.build}] - '
                         f'{tr("deleted_mod_from_lib")}.'),
             ],
             tight=True,
@@ -4887,7 +4962,7 @@ class LocalModsScreen(Column):
         bs.open = False
         bs.update()
         self.app.page.overlay.remove(bs)
-        self.app.logger.debug(f"Deleted mod {mod.name} {mod.version!r} [{mod.build}]")
+        self.app.logger.debug("Deleted mod %s %r [%s]", mod.name, mod.version, mod.build)
         await self.app.refresh_page(index=AppSections.LOCAL_MODS.value)
 
     async def update_list(self) -> None:
@@ -4896,17 +4971,18 @@ class LocalModsScreen(Column):
         await self.app.load_distro_async()
 
         mod_items = self.mods_list_view.current.controls
+        # shown family can have another variant selected, so tracking by ids of its main mods
         self.tracked_loaded_mods = set()
         for mod_obj in mod_items:
-            self.tracked_loaded_mods.add(mod_obj.mod.id_str)
+            self.tracked_loaded_mods |= mod_obj.main_mod_ids
 
         if self.app.config.current_distro:
-            self.app.logger.debug(f"Have current distro {self.app.config.current_distro}")
+            self.app.logger.debug("Have current distro %s", self.app.config.current_distro)
         else:
             self.app.logger.debug("No current distro")
 
         if self.app.config.current_game:
-            self.app.logger.debug(f"Have current game {self.app.config.current_game}")
+            self.app.logger.debug("Have current game %s", self.app.config.current_game)
         else:
             self.app.logger.debug("No current game")
 
@@ -4922,42 +4998,31 @@ class LocalModsScreen(Column):
         self.mods_list_view.current.visible = not no_mods and not no_env
         self.mods_archived_list_view.current.visible = not no_archives and not no_env
 
-        session_mods = set()
+        # families are keyed by (installment, mod name)
+        mod_families: defaultdict[tuple[str, str], list[Mod]] = defaultdict(list)
+        for mod_obj in self.app.session.mods.values():
+            mod_families[mod_obj.installment, mod_obj.name].append(mod_obj)
 
         mods_to_show: list[ModFamily] = []
 
-        mod_families: dict[str, list[Mod]] = {}
-
-        self.mod_family_items: dict[str, ModFamily] = {}
-
-        for mod_obj in self.app.session.mods.values():
-            installment = mod_obj.installment
-            mod_name = mod_obj.name
-            if mod_families.get(installment+mod_name) is None:
-                mod_families[installment+mod_name] = [mod_obj]
-            else:
-                mod_families[installment+mod_name].append(mod_obj)
+        self.mod_family_items: dict[tuple[str, str], ModFamily] = {}
 
         for mod_family, mods in mod_families.items():
-            if all(mod.id_str in self.tracked_loaded_mods for mod in mods):
+            family_ids = {mod.id_str for mod in mods}
+            if family_ids <= self.tracked_loaded_mods:
                 continue
+            new_ids = family_ids - self.tracked_loaded_mods
 
-            if self.mod_family_items.get(mod_family) is None:
-                self.mod_family_items[mod_family] = ModFamily(self.app, mod_family)
-
-            mod_family_item = self.mod_family_items.get(mod_family)
+            installment, mod_name = mod_family
+            mod_family_item = ModFamily(self.app, installment + mod_name)
             for mod in mods:
-                if mod.id_str not in self.tracked_loaded_mods:
-                    self.app.logger.debug(f"Adding mod {mod.id_str} to list")
+                if mod.id_str in new_ids:
+                    self.app.logger.debug("Adding mod %s to list", mod.id_str)
                     mod_family_item.add_main_mod(mod)
-                    session_mods.add(mod.id_str)
-                    # self.tracked_loaded_mods.add(mod.id_str)
-                else:
-                    # self.app.logger.debug(f"Mod {mod.id_str} already in list")
-                    pass
+            self.mod_family_items[mod_family] = mod_family_item
             mods_to_show.append(mod_family_item)
 
-        mods_to_show.sort(key=lambda item: item.mod.id_str.lower())
+        mods_to_show.sort(key=operator.attrgetter("mod.id_str_lower"))
 
         for mod_family in mods_to_show:
             installed_variants = [mod for mod in mod_family.variants.values()
@@ -4972,35 +5037,32 @@ class LocalModsScreen(Column):
 
             self.mods_list_view.current.controls.append(mod_family)
 
-        outdated_mods = self.tracked_loaded_mods - session_mods
+        # mods which are shown but no longer loaded in session
+        outdated_mods = self.tracked_loaded_mods - {mod.id_str for mod in self.app.session.mods.values()}
         if outdated_mods:
-            for mod_obj in mod_items:
-                if mod_obj.main_mod.id_str in outdated_mods:
-                    self.app.logger.debug(f"Removing mod {mod_obj.main_mod.id_str} from list")
-                    mod_items.remove(mod_obj)
+            self.app.logger.debug("Removing mods %s from list", outdated_mods)
+            # slice assignment keeps the list object tracked by the list view
+            mod_items[:] = [mod_obj for mod_obj in mod_items if not mod_obj.main_mod_ids & outdated_mods]
 
         archived_mod_items = self.mods_archived_list_view.current.controls
-        tracked_archived_mods = {mod_item.mod.id_str for mod_item in archived_mod_items}
         for path, mod_dummy in self.app.context.archived_mods.items():
             if mod_dummy.id_str in self.tracked_loaded_mods:
                 # TODO: investigate dead code
                 self.mods_archived_list_view.current
                 # self.app.logger.info(f"Archived mod id '{mod_dummy.id_str}' is already tracked in main list")
-            elif mod_dummy.id_str in tracked_archived_mods:
+            elif mod_dummy.id_str in self.tracked_archived_mods:
                 pass
                 # self.app.logger.info(f"Archived mod id '{mod_dummy.id_str}' is already tracked as a zip")
             else:
                 # self.app.logger.info(f"Archived mod id '{mod_dummy.id_str}' - adding to list")
-                self.mods_archived_list_view.current.controls.append(
-                    ModArchiveItem(self.app, self, path, mod_dummy)
-                )
+                archived_mod_items.append(ModArchiveItem(self.app, self, path, mod_dummy))
+                self.tracked_archived_mods.add(mod_dummy.id_str)
                 # self.mods_archived_list_view.current.update()
-        for mod_obj in archived_mod_items:
-            if mod_obj.mod.id_str in self.tracked_loaded_mods:
-                archived_mod_items.remove(mod_obj)
-                # self.app.logger.debug(f"Removed archived {mod_item.mod.id_str} from list, already tracked")
+        archived_mod_items[:] = [mod_obj for mod_obj in archived_mod_items
+                                 if mod_obj.mod.id_str not in self.tracked_loaded_mods]
+        self.tracked_archived_mods -= self.tracked_loaded_mods
 
-        self.app.logger.debug(f"{len(self.mods_list_view.current.controls)} elements in mods list view")
+        self.app.logger.debug("%d elements in mods list view", len(self.mods_list_view.current.controls))
         # if self.tracked_loaded_mods:
         #     self.app.logger.debug(f"Tracked mods: {self.tracked_loaded_mods}")
         # else:
@@ -5009,24 +5071,32 @@ class LocalModsScreen(Column):
 
     async def load_mod_archive_result(self, e: ft.FilePickerResultEvent) -> None:
         if e.files:
-            self.app.logger.debug(f"path: {e.files}")
-            for file in e.files:
-                loading_text = await self.app.show_loading(
-                    file.path,
-                    tr("reading_archive").capitalize())
-                await asyncio.sleep(0.1)
-                manifest, manifest_root_dir, file_list, exception = \
-                    await self.app.context.get_archive_manifest(file.path, loading_text=loading_text)
-
-                if manifest:
-                    mod_archived, exception = await self.app.context.get_archived_mod(
-                        file.path, manifest, manifest_root_dir, file_list)
-                else:
-                    mod_archived = None
+            self.app.logger.debug("path: %s", e.files)
+            loading_text = await self.app.show_loading(
+                "\n".join(file.path for file in e.files),
+                tr_cap("reading_archive"))
+            # progress text can only describe a single archive
+            if len(e.files) > 1:
+                loading_text = None
+
+            semaphore = asyncio.Semaphore(4)
+
+            async def read_archive(archive_path: str) -> tuple[dict | None, Mod | None, Exception | None]:
+                async with semaphore:
+                    manifest, manifest_root_dir, file_list, exception = \
+                        await self.app.context.get_archive_manifest(archive_path, loading_text=loading_text)
+
+                    if manifest:
+                        mod_archived, exception = await self.app.context.get_archived_mod(
+                            archive_path, manifest, manifest_root_dir, file_list)
+                    else:
+                        mod_archived = None
+                    return manifest, mod_archived, exception
+
+            results = await asyncio.gather(*(read_archive(file.path) for file in e.files))
 
-                await self.app.close_alert()
-                await asyncio.sleep(0.1)
-                added_mods = [mod.key for mod in self.mods_archived_list_view.current.controls]
+            await self.app.close_alert()
+            for file, (manifest, mod_archived, exception) in zip(e.files, results, strict=True):
                 if mod_archived is None:
                     file_path = file.path
                     description = tr("issue_with_archive")
@@ -5063,16 +5133,17 @@ class LocalModsScreen(Column):
                             additional_as_markdown=True)
 
                 elif (mod_archived.id_str in self.app.session.tracked_mods
-                      or mod_archived.id_str in added_mods):
-                    self.app.logger.info(f"Archived mod id '{mod_archived.id_str}' is already tracked")
+                      or mod_archived.id_str in self.tracked_archived_mods):
+                    self.app.logger.info("Archived mod id '%s' is already tracked", mod_archived.id_str)
                     await self.app.show_alert(
                         f"{mod_archived.display_name} {mod_archived.version!r} [{mod_archived.build}]",
-                        tr("mod_already_in_library").capitalize())
+                        tr_cap("mod_already_in_library"))
                 else:
-                    self.app.logger.info(f"Archived mod id '{mod_archived.id_str}' - adding to list")
+                    self.app.logger.info("Archived mod id '%s' - adding to list", mod_archived.id_str)
                     self.mods_archived_list_view.current.controls.append(
                         ModArchiveItem(self.app, self, file.path, mod_archived)
                     )
+                    self.tracked_archived_mods.add(mod_archived.id_str)
                     self.app.context.archived_mods[file.path] = mod_archived
 
                     self.mods_archived_list_view.current.visible = True
@@ -5085,9 +5156,53 @@ class LocalModsScreen(Column):
             allowed_extensions=["zip", "7z"])
 
     async def open_clicked(self, e: ft.ControlEvent) -> None:
-        open_dir_in_os(self.app.game.game_root_path)
+        # dir check and opener call can stall on slow drives, keep them off the event loop
+        await asyncio.to_thread(open_dir_in_os, self.app.game.game_root_path)
         self.update()
 
+    def get_mods_tooltip(self) -> ft.Tooltip:
+        mods_text = self.app.game.installed_descriptions_text
+        tooltip_key = (self.app.config.lang, mods_text, bool(self.app.game.game_root_path))
+        if self.mods_tooltip is not None and self.mods_tooltip.data == tooltip_key:
+            return self.mods_tooltip
+
+        self.mods_tooltip = ft.Tooltip(
+            message=mods_text,
+            visible=bool(mods_text),
+            data=tooltip_key,
+            content=Row([
+                Icon(ft.icons.BUILD_ROUNDED, size=14, color=ft.colors.PRIMARY),
+                Text(tr_cap("has_mods"),
+                     weight=ft.FontWeight.W_500,
+                     color=ft.colors.PRIMARY),
+                ft.Tooltip(
+                    message=tr("open_in_explorer"),
+                    wait_duration=300,
+                    visible=bool(self.app.game.game_root_path),
+                    content=IconButton(
+                        icon=icons.FOLDER_OPEN,
+                        icon_color=ft.colors.PRIMARY,
+                        on_click=self.open_clicked,
+                        scale=0.7))
+                ], spacing=5))
+        return self.mods_tooltip
+
+    def get_game_running_tooltip(self) -> ft.Tooltip:
+        tooltip_key = (self.app.config.lang, self.app.game.target_exe)
+        if self.game_running_tooltip is None or self.game_running_tooltip.data != tooltip_key:
+            self.game_running_tooltip = ft.Tooltip(
+                message=self.app.game.target_exe,
+                data=tooltip_key,
+                content=Row([
+                    Icon(ft.icons.PENDING_ROUNDED, size=14, color=ft.colors.TERTIARY),
+                    Text(tr("game_is_running"),
+                         weight=ft.FontWeight.W_500,
+                         color=ft.colors.TERTIARY)
+                    ], spacing=5))
+        # running state changes more often than the game, so only visibility is refreshed for it
+        self.game_running_tooltip.visible = self.game_is_running
+        return self.game_running_tooltip
+
     def get_game_info(self) -> ft.Card:
         if not self.app.game.game_root_path:
             return ft.Card(
@@ -5104,30 +5219,20 @@ class LocalModsScreen(Column):
                                 no_wrap=False,
                                 ),
                            Row([Text(tr("launch_game_placeholder")),
-                                ft.TextButton(tr("settings").capitalize(),
+                                ft.TextButton(tr_cap("settings"),
                                               icon=ft.icons.SETTINGS_OUTLINED,
                                               on_click=self.app.show_settings),
                                 ], spacing=2)
                             ], expand=8)
                    ], spacing=19),
-                   padding=ft.padding.only(left=20, right=35, top=25, bottom=25)
+                   padding=_PLACEHOLDER_CARD_PADDING
                ), elevation=5, margin=ft.margin.only(left=80, right=80, bottom=10))
 
-        match self.app.game.installment:
-            case "exmachina":
-                if self.app.game.patched_version:
-                    ico_path = get_internal_file_path("assets/icons/hta_comrem.png")
-                else:
-                    ico_path = get_internal_file_path("assets/icons/original_hta.png")
-            case "m113":
-                ico_path = get_internal_file_path("assets/icons/original_m113.png")
-            case "arcade":
-                ico_path = get_internal_file_path("assets/icons/original_arcade.png")
-
-        if self.app.game.installed_descriptions:
-            mods_text = "\n\n".join(self.app.game.installed_descriptions.values())
-        else:
-            mods_text = ""
+        installment = self.app.game.installment
+        if installment == "exmachina" and self.app.game.patched_version:
+            installment = "exmachina_patched"
+        ico_path = _GAME_ICONS.get(installment)
+
         return ft.Card(
             ft.Container(
                 Row([
@@ -5140,33 +5245,8 @@ class LocalModsScreen(Column):
                                  no_wrap=False),
                             Text(f"[{self.app.game.exe_version_tr}]",
                                  weight=ft.FontWeight.W_500),
-                            ft.Tooltip(
-                                message=mods_text,
-                                visible=bool(mods_text),
-                                content=Row([
-                                    Icon(ft.icons.BUILD_ROUNDED, size=14, color=ft.colors.PRIMARY),
-                                    Text(tr("has_mods").capitalize(),
-                                         weight=ft.FontWeight.W_500,
-                                         color=ft.colors.PRIMARY),
-                                    ft.Tooltip(
-                                        message=tr("open_in_explorer"),
-                                        wait_duration=300,
-                                        visible=bool(self.app.game.game_root_path),
-                                        content=IconButton(
-                                            icon=icons.FOLDER_OPEN,
-                                            icon_color=ft.colors.PRIMARY,
-                                            on_click=self.open_clicked,
-                                            scale=0.7))
-                                    ], spacing=5)),
-                            ft.Tooltip(
-                                message=self.app.game.target_exe,
-                                visible=self.game_is_running,
-                                content=Row([
-                                    Icon(ft.icons.PENDING_ROUNDED, size=14, color=ft.colors.TERTIARY),
-                                    Text(tr("game_is_running"),
-                                         weight=ft.FontWeight.W_500,
-                                         color=ft.colors.TERTIARY)
-                                    ], spacing=5))
+                            self.get_mods_tooltip(),
+                            self.get_game_running_tooltip()
                             ]),
                         Text(self.app.config.game_names[self.app.config.current_game],
                              tooltip=self.app.game.game_root_path),
@@ -5181,64 +5261,80 @@ class LocalModsScreen(Column):
                 padding=ft.padding.symmetric(horizontal=15, vertical=15)
             ), elevation=5, margin=ft.margin.only(left=20, right=20, bottom=5),
             surface_tint_color=ft.colors.TERTIARY,
-            col={"xs": 12, "xl": 11, "xxl": 10})
+            col=_COL_LIBRARY)
+
+    def get_no_distro_placeholder(self) -> list[ft.Control]:
+        # placeholder is static apart from translations, so it's only rebuilt on language change
+        if self.no_distro_placeholder is not None and self.no_distro_placeholder_lang == self.app.config.lang:
+            return list(self.no_distro_placeholder)
+
+        self.no_distro_placeholder_lang = self.app.config.lang
+        self.no_distro_placeholder = [
+            Text(tr_cap("mods_library"),
+                 theme_style=ft.TextThemeStyle.TITLE_MEDIUM),
+            ft.Card(
+               ft.Container(
+                   Row([
+                       ft.Icon(ft.icons.BOOKMARK_ADD_ROUNDED,
+                               size=40,
+                               color=ft.colors.TERTIARY,
+                               expand=1),
+                       Column([
+                           Text(tr("commod_needs_distro"),
+                                weight=ft.FontWeight.BOLD,
+                                no_wrap=False,
+                                ),
+                           Row([Text(tr("local_mods_placeholder")),
+                                ft.TextButton(tr_cap("settings"),
+                                              icon=ft.icons.SETTINGS_OUTLINED,
+                                              on_click=self.app.show_settings),
+                                ], spacing=2)
+                            ], expand=8)
+                   ], spacing=19),
+                   padding=_PLACEHOLDER_CARD_PADDING
+               ), elevation=5, margin=ft.margin.only(left=80, right=80, bottom=10))
+            ]
+        return list(self.no_distro_placeholder)
 
     def build(self) -> None:
         self.horizontal_alignment=ft.CrossAxisAlignment.CENTER
 
         if not self.app.context.distribution_dir:
-            self.controls = [
-                    Text(tr("mods_library").capitalize(),
-                         theme_style=ft.TextThemeStyle.TITLE_MEDIUM),
-                    ft.Card(
-                       ft.Container(
-                           Row([
-                               ft.Icon(ft.icons.BOOKMARK_ADD_ROUNDED,
-                                       size=40,
-                                       color=ft.colors.TERTIARY,
-                                       expand=1),
-                               Column([
-                                   Text(tr("commod_needs_distro"),
-                                        weight=ft.FontWeight.BOLD,
-                                        no_wrap=False,
-                                        ),
-                                   Row([Text(tr("local_mods_placeholder")),
-                                        ft.TextButton(tr("settings").capitalize(),
-                                                      icon=ft.icons.SETTINGS_OUTLINED,
-                                                      on_click=self.app.show_settings),
-                                        ], spacing=2)
-                                    ], expand=8)
-                           ], spacing=19),
-                           padding=ft.padding.only(left=20, right=35, top=25, bottom=25)
-                       ), elevation=5, margin=ft.margin.only(left=80, right=80, bottom=10))
-                    ]
+            self.controls = self.get_no_distro_placeholder()
             return
+        # list views are recreated on every build
+        self.tracked_archived_mods = set()
         self.controls = [
-            Row([Text(tr("mods_library").capitalize(),
+            Row([Text(tr_cap("mods_library"),
                       theme_style=ft.TextThemeStyle.TITLE_MEDIUM)],
                 alignment=ft.MainAxisAlignment.CENTER),
             ft.Column([
                 ft.Container(
                     ft.ResponsiveRow([
                         ft.Container(ref=self.game_info,
-                                     col={"xs": 12, "xl": 11, "xxl": 10}),
-                        Text(tr("no_local_mods_found").capitalize(),
+                                     col=_COL_LIBRARY),
+                        Text(tr_cap("no_local_mods_found"),
                              visible=False,
                              ref=self.no_mods_warning,
                              weight=ft.FontWeight.BOLD,
                              color=ft.colors.PRIMARY,
-                             col={"xs": 12, "xl": 11, "xxl": 10},
+                             col=_COL_LIBRARY,
                              text_align=ft.TextAlign.CENTER),
+                        # item_extent/first_item_prototype are not used as mod items expand to show
+                        # details, lists are also sized by their content inside the scrolling column
+                        # lists stay hidden until update_list fills them
                         ft.ListView([], spacing=10, padding=0,
                                     ref=self.mods_list_view,
                                     semantic_child_count=1,
                                     on_scroll_interval=100,
-                                    col={"xs": 12, "xl": 11, "xxl": 10}),
+                                    visible=False,
+                                    col=_COL_LIBRARY),
                         ft.ListView([], spacing=10, padding=0,
                                     ref=self.mods_archived_list_view,
                                     semantic_child_count=1,
                                     on_scroll_interval=100,
-                                    col={"xs": 12, "xl": 11, "xxl": 10}),
+                                    visible=False,
+                                    col=_COL_LIBRARY),
                         ft.Card(ft.Container(
                             Column([
                                 Text(tr("archived_mods_explanation"),
@@ -5248,7 +5344,7 @@ class LocalModsScreen(Column):
                                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                                        ref=self.add_mods_column),
                                 ft.FloatingActionButton(
-                                    tr("add_mod").capitalize(),
+                                    tr_cap("add_mod"),
                                     mini=True,
                                     on_click=self.load_archive,
                                     height=40,
@@ -5257,7 +5353,7 @@ class LocalModsScreen(Column):
                                 horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                             border_radius=10, padding=20),
                             height=10, ref=self.add_mod_card,
-                            col={"xs": 12, "xl": 11, "xxl": 10})
+                            col=_COL_LIBRARY)
                         ],
                         alignment=ft.MainAxisAlignment.CENTER),
                     padding=ft.padding.only(right=22), alignment=ft.alignment.top_center),
@@ -5272,11 +5368,19 @@ class DownloadModsScreen(ft.Column):
         super().__init__(**kwargs)
         self.app = app
         self.refreshing = False
+        # screen content is static apart from translations, so it's only rebuilt on language change
+        self.static_controls: list[ft.Control] | None = None
+        self.static_controls_lang: str | None = None
 
     def build(self) -> None:
         self.horizontal_alignment=ft.CrossAxisAlignment.CENTER
-        self.controls = [
-            Text(tr("download").capitalize(),
+        if self.static_controls is not None and self.static_controls_lang == self.app.config.lang:
+            self.controls = list(self.static_controls)
+            return
+
+        self.static_controls_lang = self.app.config.lang
+        self.static_controls = [
+            Text(tr_cap("download"),
                  theme_style=ft.TextThemeStyle.TITLE_MEDIUM),
             ft.Card(
                 ft.Container(
@@ -5313,6 +5417,51 @@ class DownloadModsScreen(ft.Column):
                     padding=ft.padding.only(left=30, right=30, top=30, bottom=20)
                 ), elevation=5, margin=ft.margin.symmetric(horizontal=80))
             ]
+        self.controls = list(self.static_controls)
+
+
+class LaunchParamsMenu(ft.PopupMenuButton):
+    """Menu of game launch options, toggled by the handlers of the launch screen."""
+
+    # icon, localised name getter, checked state getter, home screen handler and ref names,
+    # whether option is only available on Windows
+    _LAUNCH_OPTS_SPEC = (
+        (ft.icons.FULLSCREEN_ROUNDED, partial(tr_cap, "windowed_mode"),
+         lambda game: not game.fullscreen_game,
+         "switch_to_windowed", "checkbox_windowed_game", False),
+        (ft.icons.FOUR_K_ROUNDED, partial(tr, "hi_dpi_aware"),
+         operator.attrgetter("hi_dpi_aware"),
+         "switch_to_hidpi_aware", "checkbox_hi_dpi_aware", True),
+        (ft.icons.SETTINGS_APPLICATIONS_OUTLINED, partial(tr, "fullscreen_optimizations"),
+         operator.attrgetter("fullscreen_opts_disabled"),
+         "switch_fullscreen_optimizations", "checkbox_fullsreen_opts", True),
+    )
+
+    def __init__(self, home: "HomeScreen", **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(**kwargs)
+        self.tooltip = tr_cap("launch_params")
+        game = home.app.game
+        under_windows = home.app.context.under_windows
+        self.items = [
+            *(ft.PopupMenuItem(
+                content=Row([Icon(icon), Text(get_name(), width=160, size=13)]),
+                checked=is_checked(game),
+                on_click=getattr(home, handler_name),
+                ref=getattr(home, ref_name),
+                disabled=windows_only and not under_windows)
+              for icon, get_name, is_checked, handler_name, ref_name, windows_only
+              in self._LAUNCH_OPTS_SPEC),
+            ft.PopupMenuItem(),
+            ft.PopupMenuItem(
+                content=ft.Container(
+                    Row([Icon(ft.icons.QUESTION_MARK_OUTLINED,
+                              color=ft.colors.ON_BACKGROUND),
+                         Text(tr_cap("launch_options_instructions"),
+                              width=190,
+                              size=13)]),
+                    margin=_MENU_ITEM_INDENT_MARGIN),
+                on_click=home.show_launch_opts_instruction)
+            ]
 
 
 class HomeScreen(ft.Container):
@@ -5322,11 +5471,24 @@ class HomeScreen(ft.Container):
         self.markdown_content = ft.Ref[ft.Markdown]()
         self.checking_online = ft.Ref[Row]()
         self.news_text = None
+        self.news_lock = asyncio.Lock()
+        self.launch_lock = asyncio.Lock()
+        self.launch_prompt_task: asyncio.Task | None = None
         self.game_console_switch = ft.Ref[ft.Switch]()
         self.launch_game_btn = ft.Ref[ft.FloatingActionButton]()
         self.launch_game_btn_text = ft.Ref[Text]()
         self.launch_prog_ring = ft.Ref[ft.ProgressRing]()
 
+        self.no_game_placeholder: Column | None = None
+        # game selector shown when only one game is known, has no inputs so it's created once per screen
+        self.single_game_badge: ft.Container | None = None
+        # parts of the game info column, reused between builds while their inputs stay the same
+        self.logo_section: ft.Control | None = None
+        self.info_msg_row: Row | None = None
+        self.mods_info_column: Column | None = None
+        self.home_content: ft.ResponsiveRow | None = None
+        self.info_msg = ft.Ref[ft.Container]()
+
         self.launch_params_menu = ft.Ref[ft.PopupMenuButton]()
         self.checkbox_windowed_game = ft.Ref[ft.PopupMenuItem]()
         self.checkbox_hi_dpi_aware = ft.Ref[ft.PopupMenuItem]()
@@ -5334,6 +5496,9 @@ class HomeScreen(ft.Container):
 
         self.refreshing = False
         self.game_is_running = False
+        # news loading state, build runs before did_mount resets it for a new loading attempt
+        self.got_news = False
+        self.offline = False
 
         self.margin = ft.margin.only(bottom=20)
         self.expand = True
@@ -5364,52 +5529,118 @@ class HomeScreen(ft.Container):
             # task.add_done_callback(background_tasks.discard)
         else:
             self.app.logger.debug("No game found")
-        if self.app.current_game_process is not None:
+        if self.app.current_game_process is not None and not self.launching_prompt_shown:
             self.page.run_task(self.synchronise_launch_btn_prompt, started=True)
 
     async def load_news(self) -> None:
-        if not self.offline:
-            if self.news_text is not None:
-                self.markdown_content.current.value = self.news_text
-                self.markdown_content.current.update()
+        # did_mount can schedule loading again while previous request is still in flight
+        async with self.news_lock:
+            # loaded news (or placeholder when offline) are already set as markdown value by build
+            if self.offline or self.news_text is not None:
                 return
 
-            # await asyncio.sleep(1)
-            mappings = "https://raw.githubusercontent.com/DeusExMachinaTeam/ComModNews/main/langs.yaml"
-            async with httpx.AsyncClient() as client:
-                response_map = await client.get(mappings)
-                if response_map.status_code == HTTPStatus.OK:
-                    lang_mappings = load_yaml(response_map.text)
-                    if not isinstance(lang_mappings, dict):
-                        self.app.logger.error("Online news loading: Couldn't parse lang mappings as yaml")
-                        return
-
-                    dem_news_stem = lang_mappings.get(self.app.config.lang)
-                    if dem_news_stem is None:
-                        self.app.logger.error("Online news loading: Couldn't get current lang from lang mappings")
-
-                    response = await client.get(
-                        url=(f"https://raw.githubusercontent.com/DeusExMachinaTeam/ComModNews/main/"
-                             f"{dem_news_stem}"))
-
-                    if response.status_code == HTTPStatus.OK:
-                        md_raw = response.text
-                        md = process_markdown(md_raw)
-                        self.markdown_content.current.value = md
-                        self.checking_online.current.visible = False
-                        if self.app.is_current_page(HomeScreen):
-                            self.checking_online.current.update()
-                            self.markdown_content.current.update()
-                        self.news_text = md
-                        self.got_news = True
-                    else:
-                        self.app.logger.error(f"bad response '{response.status_code}'")
+            try:
+                await self.fetch_news()
+            finally:
+                # placeholder is shown if news failed to load
+                if not self.markdown_content.current.visible:
+                    self.markdown_content.current.visible = True
+                    if self.app.is_current_page(HomeScreen):
+                        self.markdown_content.current.update()
+
+    @staticmethod
+    def read_news_cache() -> tuple[str, dict]:
+        """Return path to news cache and its contents, which are empty if cache is missing or broken."""
+        news_cache_path = os.path.join(InstallationContext.get_local_config_path(), NEWS_CACHE_FILE)
+        news_cache = read_yaml(news_cache_path) if os.path.exists(news_cache_path) else None
+        if not isinstance(news_cache, dict):
+            news_cache = {}
+        return news_cache_path, news_cache
+
+    async def fetch_news(self) -> None:
+        news_cache_path, news_cache = await asyncio.to_thread(self.read_news_cache)
+        cache_updates = {}
+
+        mappings = f"{NEWS_REPO_URL}langs.yaml"
+        # news are requested together with mappings if we know from cache where to find them
+        cached_mappings = news_cache.get(mappings)
+        guessed_stem = None
+        if isinstance(cached_mappings, dict) and isinstance(cached_mappings.get("text"), str):
+            old_lang_mappings = load_yaml(cached_mappings["text"])
+            if isinstance(old_lang_mappings, dict):
+                guessed_stem = old_lang_mappings.get(self.app.config.lang)
+
+        async with httpx.AsyncClient() as client:
+            requests = [self.fetch_with_cache(client, mappings, news_cache, cache_updates)]
+            if guessed_stem is not None:
+                requests.append(self.fetch_with_cache(
+                    client, f"{NEWS_REPO_URL}{guessed_stem}", news_cache, cache_updates))
+            # speculative request failing shouldn't affect loading of mappings
+            mappings_text, *guessed_md = await asyncio.gather(*requests, return_exceptions=True)
+            if isinstance(mappings_text, BaseException):
+                raise mappings_text
+            if guessed_md and isinstance(guessed_md[0], BaseException):
+                self.app.logger.debug("Couldn't get news guessed from cached mappings: %r", guessed_md[0])
+                guessed_md = []
+
+            if mappings_text is not None:
+                lang_mappings = load_yaml(mappings_text)
+                if not isinstance(lang_mappings, dict):
+                    self.app.logger.error("Online news loading: Couldn't parse lang mappings as yaml")
+                    return
+
+                dem_news_stem = lang_mappings.get(self.app.config.lang)
+                if dem_news_stem is None:
+                    self.app.logger.error("Online news loading: Couldn't get current lang from lang mappings")
+
+                if guessed_md and dem_news_stem == guessed_stem:
+                    md_raw = guessed_md[0]
                 else:
-                    self.app.logger.error("Unable to get url content for news")
+                    md_raw = await self.fetch_with_cache(
+                        client, f"{NEWS_REPO_URL}{dem_news_stem}", news_cache, cache_updates)
+
+                if md_raw is not None:
+                    md = process_markdown(md_raw)
+                    self.markdown_content.current.value = md
+                    self.markdown_content.current.visible = True
                     self.checking_online.current.visible = False
                     if self.app.is_current_page(HomeScreen):
                         self.checking_online.current.update()
-                    self.offline = True
+                        self.markdown_content.current.update()
+                    self.news_text = md
+                    self.got_news = True
+            else:
+                self.app.logger.error("Unable to get url content for news")
+                self.checking_online.current.visible = False
+                if self.app.is_current_page(HomeScreen):
+                    self.checking_online.current.update()
+                self.offline = True
+
+        if cache_updates:
+            await asyncio.to_thread(dump_yaml, news_cache | cache_updates, news_cache_path)
+
+    async def fetch_with_cache(self, client: httpx.AsyncClient, url: str,
+                               cache: dict, cache_updates: dict) -> str | None:
+        """Get url content, reusing cached text if server reports it as not modified.
+
+        New ETags and content are collected in cache_updates to be saved afterwards
+        """
+        cached = cache.get(url)
+        headers = {}
+        if isinstance(cached, dict) and cached.get("etag") and isinstance(cached.get("text"), str):
+            headers["If-None-Match"] = cached["etag"]
+
+        response = await client.get(url, headers=headers)
+        if response.status_code == HTTPStatus.NOT_MODIFIED and headers:
+            return cached["text"]
+        if response.status_code != HTTPStatus.OK:
+            self.app.logger.error(f"bad response '{response.status_code}' for '{url}'")
+            return None
+
+        etag = response.headers.get("ETag")
+        if etag:
+            cache_updates[url] = {"etag": etag, "text": response.text}
+        return response.text
 
     async def launch_url(self, e: ft.ControlEvent) -> None:
         await self.app.page.launch_url_async(e.data)
@@ -5424,105 +5655,96 @@ class HomeScreen(ft.Container):
         if self.app.current_game_process.returncode is None:
             pass
 
+    @contextlib.asynccontextmanager
+    async def changing_launch_params(self) -> AsyncIterator[None]:
+        """Hold game launch while launch params are changed, updating params menu afterwards."""
+        async with self.launch_lock:
+            try:
+                yield
+            finally:
+                # just an additional safeguard, game launch is delayed by 1 second after game_change_time
+                self.app.game_change_time = time.monotonic()
+                self.launch_params_menu.current.update()
+
     async def switch_to_windowed(self, e: ft.ControlEvent) -> None:
-        # temporarily disabling game launch
-        self.launch_game_btn.current.disabled = True
-        # self.launch_game_btn.current.update()
-
-        self.checkbox_windowed_game.current.checked = not self.checkbox_windowed_game.current.checked
-        # self.checkbox_windowed_game.current.update()
-        if self.app.game.game_root_path:
-            # just an additional safeguard, all actions on game
-            # are delayed by 1 second after game_change_time
-            self.app.game_change_time = datetime.now()
-            await self.app.game.switch_windowed(monitor_res=self.app.context.monitor_res,
-                                                enable=not self.checkbox_windowed_game.current.checked)
-
-        self.launch_game_btn.current.disabled = False
-        # self.launch_game_btn.current.update()
-        self.update()
+        async with self.changing_launch_params():
+            self.checkbox_windowed_game.current.checked = not self.checkbox_windowed_game.current.checked
+            if self.app.game.game_root_path:
+                await self.app.game.switch_windowed(monitor_res=self.app.context.monitor_res,
+                                                    enable=not self.checkbox_windowed_game.current.checked)
 
     async def switch_to_hidpi_aware(self, e: ft.ControlEvent) -> None:
-        # temporarily disabling game launch
-        self.launch_game_btn.current.disabled = True
-        # self.launch_game_btn.current.update()
-
-        self.checkbox_hi_dpi_aware.current.checked = not self.checkbox_hi_dpi_aware.current.checked
-        if self.app.game.game_root_path:
-            # just an additional safeguard, all actions on game
-            # are delayed by 1 second after game_change_time
-            self.app.game_change_time = datetime.now()
-            result_ok = self.app.game.switch_hi_dpi_aware(enable=self.checkbox_hi_dpi_aware.current.checked)
-            if not result_ok:
-                self.checkbox_hi_dpi_aware.current.checked = not self.checkbox_hi_dpi_aware.current.checked
-                await self.app.show_alert(tr("no_access_to_registry_cant_set"))
-
-        # self.checkbox_hi_dpi_aware.current.update()
-
-        self.launch_game_btn.current.disabled = False
-        # self.launch_game_btn.current.update()
-        self.update()
+        async with self.changing_launch_params():
+            checkbox = self.checkbox_hi_dpi_aware.current
+            checkbox.checked = not checkbox.checked
+            if self.app.game.game_root_path:
+                result_ok = self.app.game.switch_hi_dpi_aware(enable=checkbox.checked)
+                if not result_ok:
+                    checkbox.checked = not checkbox.checked
+                    await self.app.show_alert(tr("no_access_to_registry_cant_set"))
 
     async def switch_fullscreen_optimizations(self, e: ft.ControlEvent) -> None:
-        # temporarily disabling game launch
-        self.launch_game_btn.current.disabled = True
-        # self.launch_game_btn.current.update()
-
-        self.checkbox_fullsreen_opts.current.checked = not self.checkbox_fullsreen_opts.current.checked
-        if self.app.game.game_root_path:
-            # just an additional safeguard, all actions on game
-            # are delayed by 1 second after game_change_time
-            self.app.game_change_time = datetime.now()
-            result_ok = self.app.game.switch_fullscreen_opts(
-                disable=self.checkbox_fullsreen_opts.current.checked)
-            if not result_ok:
-                self.checkbox_fullsreen_opts.current.checked = \
-                    not self.checkbox_fullsreen_opts.current.checked
-                await self.app.show_alert(tr("no_access_to_registry_cant_set"))
-
-        # self.checkbox_fullsreen_opts.current.update()
-
-        self.launch_game_btn.current.disabled = False
-        # self.launch_game_btn.current.update()
-        self.update()
+        async with self.changing_launch_params():
+            self.checkbox_fullsreen_opts.current.checked = not self.checkbox_fullsreen_opts.current.checked
+            if self.app.game.game_root_path:
+                result_ok = self.app.game.switch_fullscreen_opts(
+                    disable=self.checkbox_fullsreen_opts.current.checked)
+                if not result_ok:
+                    self.checkbox_fullsreen_opts.current.checked = \
+                        not self.checkbox_fullsreen_opts.current.checked
+                    await self.app.show_alert(tr("no_access_to_registry_cant_set"))
+
+    def set_launch_params_disabled(self, disabled: bool) -> tuple[ft.Control, ...]:
+        """Change state of launch params controls without updating, returning changed controls."""
+        self.launch_params_menu.current.disabled = disabled
+        self.game_console_switch.current.disabled = disabled
+        return self.launch_params_menu.current, self.game_console_switch.current
 
     async def enable_launch_params(self) -> None:
-        self.launch_params_menu.current.disabled = False
-        self.game_console_switch.current.disabled = False
+        self.set_launch_params_disabled(False)
         # self.launch_params_menu.current.update()
         # self.game_console_switch.current.update()
         self.update()
 
     async def disable_launch_params(self) -> None:
-        self.launch_params_menu.current.disabled = True
-        self.game_console_switch.current.disabled = True
+        self.set_launch_params_disabled(True)
         # self.launch_params_menu.current.update()
         # self.game_console_switch.current.update()
         self.update()
 
+    def show_launch_progress(self, shown: bool) -> None:
+        """Toggle launch progress ring, disabling launch params while it's shown, in a single update."""
+        with self.app.batched_update() as changed:
+            self.launch_prog_ring.current.visible = shown
+            changed.append(self.launch_prog_ring.current)
+            changed.extend(self.set_launch_params_disabled(shown))
+
     async def show_launch_opts_instruction(self, e: ft.ControlEvent) -> None:
         await self.app.show_modal(tr("launch_options_instruction_text"),
-                                  title=tr("launch_options_instructions").capitalize())
+                                  title=tr_cap("launch_options_instructions"))
 
     async def launch_game(self, e: ft.ControlEvent) -> None:
-        await self.disable_launch_params()
-        current_time = datetime.now()
-        self.launch_prog_ring.current.visible = True
-        self.launch_prog_ring.current.update()
-        if self.app.game_change_time is not None:  # noqa: SIM102
-            if (current_time - self.app.game_change_time).seconds < 1:
-                # do not try to relaunch game immediately after a change
-                self.launch_prog_ring.current.visible = False
-                self.launch_prog_ring.current.update()
-                return
+        if self.launch_lock.locked():
+            # previous launch or stop is still in progress, repeated clicks are skipped
+            return
+        async with self.launch_lock:
+            await self.toggle_game_process()
+
+    async def toggle_game_process(self) -> None:
+        if time.monotonic() - self.app.game_change_time < 1:
+            # do not try to relaunch game immediately after a change;
+            # when the game is launching or running, its disabled params and prompt are kept as is,
+            # otherwise page can be reused on refresh, so params are not left disabled
+            if self.app.current_game_process is None and not self.launching_prompt_shown:
+                self.show_launch_progress(False)
+            return
+        self.show_launch_progress(True)
         if self.app.current_game_process is None:
             try:
                 if self.app.game.check_is_running():
                     await self.app.show_alert(tr("game_is_already_running"))
                     self.game_is_running = True
-                    self.launch_prog_ring.current.visible = False
-                    self.launch_prog_ring.current.update()
-                    await self.enable_launch_params()
+                    self.show_launch_progress(False)
             except ExeNotFoundError:
                 self.game_is_running = False
                 await self.app.show_alert(tr("broken_game"))
@@ -5535,9 +5757,7 @@ class HomeScreen(ft.Container):
             other_game_running = await self.check_for_game()
             if other_game_running:
                 await self.app.show_alert(tr("other_game_is_already_running"))
-                self.launch_prog_ring.current.visible = False
-                self.launch_prog_ring.current.update()
-                await self.enable_launch_params()
+                self.show_launch_progress(False)
                 return
             self.app.logger.info(f"Launching: {self.app.game.target_exe}")
 
@@ -5549,10 +5769,11 @@ class HomeScreen(ft.Container):
                         self.app.game.target_exe,
                         "-console" if self.app.config.game_with_console else "",
                         cwd=self.app.game.game_root_path,
-                        # this is ugly, but allows subprocess to live after commod has exited
-                        # without pipe even creationflags didn't achieve creation of independent process here
+                        # redirecting std streams allows subprocess to live after commod has exited,
+                        # without it even creationflags didn't achieve creation of independent process here;
+                        # output is never read, so devnull is used to not block the game on a full pipe
                         # TODO: investigate further
-                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                         creationflags=subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS)
             else:
                     # commented out, questionable logic to allow execution or arbitrary shell commands here
@@ -5573,7 +5794,8 @@ class HomeScreen(ft.Container):
                     #     await self.synchronise_launch_btn_prompt(starting=False)
                 return
 
-            self.app.game_change_time = datetime.now()
+            self.app.game_change_time = time.monotonic()
+            self.app.game.reset_running_check()
             await self.synchronise_launch_btn_prompt(starting=True)
 
             task_track_game = asyncio.create_task(self.keep_track_of_game_proc())
@@ -5588,6 +5810,7 @@ class HomeScreen(ft.Container):
             # button prompt
             self.app.current_game_process.terminate()
             self.app.current_game_process = None
+            self.app.game.reset_running_check()
             await self.synchronise_launch_btn_prompt(starting=False)
             await self.enable_launch_params()
         else:
@@ -5597,39 +5820,54 @@ class HomeScreen(ft.Container):
             await self.enable_launch_params()
         self.app.game.refresh_game_launch_params(exclude_registry_params=True)
 
+    async def show_game_stopped(self) -> None:
+        """Reflect that the game has exited, rebuilding the page only if needed."""
+        if (not self.app.is_current_page(HomeScreen)
+           or self.info_msg.current is None
+           or self.app.game.installment_id not in _GAME_LOGOS):
+            await self.app.refresh_page(AppSections.LAUNCH.value)
+            return
+
+        self.game_is_running = False
+        self.info_msg.current.visible = False
+        self.checkbox_windowed_game.current.checked = not self.app.game.fullscreen_game
+        await self.enable_launch_params()
+
     async def keep_track_of_game_proc(self) -> None:
+        proc = self.app.current_game_process
+        if proc is None:
+            return
         try:
-            while True:
-                if self.app.current_game_process is None:
-                    self.app.local_mods.game_is_running = False
-                    await self.app.refresh_page(AppSections.LAUNCH.value)
-                    break
-                if self.app.current_game_process.returncode is None:
-                    pass
-                else:
-                    self.app.current_game_process = None
-                    self.app.local_mods.game_is_running = False
-                    await self.synchronise_launch_btn_prompt(starting=False)
-                    self.app.game.refresh_game_launch_params(exclude_registry_params=True)
-                    await self.app.refresh_page(AppSections.LAUNCH.value)
-                    break
-                await asyncio.sleep(3)
+            await proc.wait()
+            self.app.game.reset_running_check()
+            self.app.local_mods.game_is_running = False
+            # process is reset beforehand when the game is stopped from ComMod
+            if self.app.current_game_process is proc:
+                self.app.current_game_process = None
+                await self.synchronise_launch_btn_prompt(starting=False)
+                self.app.game.refresh_game_launch_params(exclude_registry_params=True)
+            await self.show_game_stopped()
+        except asyncio.CancelledError:
+            self.app.logger.debug("Stopped tracking game process")
+            raise
         except Exception as ex:
             ...
 
     async def synchronise_launch_btn_prompt(self, starting: bool = True, started: bool = False) -> None:
         try:
             if started:
-                self.launch_game_btn_text.current.value = tr("stop_game").capitalize()
+                self.launch_game_btn_text.current.value = tr_cap("stop_game")
                 # self.launch_game_btn_text.current.update()
             elif starting:
-                self.launch_game_btn_text.current.value = f"{tr('launching').capitalize()}..."
-                # self.launch_game_btn_text.current.update()
-                await asyncio.sleep(1)
-                self.launch_game_btn_text.current.value = tr("stop_game").capitalize()
-                # self.launch_game_btn_text.current.update()
+                self.launch_game_btn_text.current.value = f"{tr_cap('launching')}..."
+                # launching prompt is replaced in background to not hold the launch for it
+                self.launch_prompt_task = asyncio.create_task(self.finish_launching_prompt())
+                background_tasks.add(self.launch_prompt_task)
+                self.launch_prompt_task.add_done_callback(background_tasks.discard)
+                self.launch_game_btn_text.current.update()
+                return
             else:
-                self.launch_game_btn_text.current.value = tr("play").capitalize()
+                self.launch_game_btn_text.current.value = tr_cap("play")
                 # self.launch_game_btn_text.current.update()
             self.launch_prog_ring.current.visible = False
             # self.launch_prog_ring.current.update()
@@ -5637,12 +5875,34 @@ class HomeScreen(ft.Container):
         except AssertionError: # double clicking buttons causes multiple attempts in sync, can safely skip
             pass
 
+    @property
+    def launching_prompt_shown(self) -> bool:
+        return self.launch_prompt_task is not None and not self.launch_prompt_task.done()
+
+    async def finish_launching_prompt(self, delay: float = 1) -> None:
+        await asyncio.sleep(delay)
+        # game could have exited in the meantime
+        if self.app.current_game_process is not None:
+            await self.synchronise_launch_btn_prompt(started=True)
+
+    def get_launch_btn_prompt(self) -> str:
+        if self.app.current_game_process is None:
+            return tr_cap("play")
+        if self.launching_prompt_shown:
+            return f"{tr_cap('launching')}..."
+        return tr_cap("stop_game")
+
     async def change_game_console_mode(self, e: ft.ControlEvent) -> None:
         self.app.config.game_with_console = e.data == "true"
 
     def get_no_game_placeholder(self) -> Column:
-        return Column([
-            Text(tr("launch_full").capitalize(),
+        # only depends on translations and on whether any game is known
+        placeholder_key = (self.app.config.lang, bool(self.app.config.known_games))
+        if self.no_game_placeholder is not None and self.no_game_placeholder.data == placeholder_key:
+            return self.no_game_placeholder
+
+        self.no_game_placeholder = Column([
+            Text(tr_cap("launch_full"),
                  theme_style=ft.TextThemeStyle.TITLE_MEDIUM),
             ft.Card(
                ft.Container(
@@ -5658,19 +5918,20 @@ class HomeScreen(ft.Container):
                                 no_wrap=False,
                                 ),
                            Row([Text(tr("launch_game_placeholder")),
-                                ft.TextButton(tr("settings").capitalize(),
+                                ft.TextButton(tr_cap("settings"),
                                               icon=ft.icons.SETTINGS_OUTLINED,
                                               on_click=self.app.show_settings),
                                 ], spacing=2)
                             ], expand=8)
                    ], spacing=19),
-                   padding=ft.padding.only(left=20, right=35, top=25, bottom=25)
+                   padding=_PLACEHOLDER_CARD_PADDING
                ), elevation=5, margin=ft.margin.symmetric(horizontal=80))
-            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, data=placeholder_key)
+        return self.no_game_placeholder
 
     async def open_clicked(self, e: ft.ControlEvent) -> None:
-        open_dir_in_os(self.app.game.game_root_path)
-        self.update()
+        # opening the dir doesn't change anything on the page, so no update is needed
+        await asyncio.to_thread(open_dir_in_os, self.app.game.game_root_path)
 
     async def select_game_from_home(self, e: ft.ControlEvent | None = None, path: str | None = None) -> None:
         if e is not None:
@@ -5717,6 +5978,94 @@ class HomeScreen(ft.Container):
 
         await self.app.refresh_page(AppSections.LAUNCH.value)
 
+    def make_logo_section(self, installment_id: str | None) -> ft.Control:
+        if self.logo_section is not None and self.logo_section.data == installment_id:
+            return self.logo_section
+
+        logo_path = _GAME_LOGOS.get(installment_id)
+        if logo_path is not None:
+            self.logo_section = Image(src=logo_path, fit=ft.ImageFit.FILL)
+        else:
+            self.logo_section = ft.Stack([
+                Image(src=_GAME_LOGOS[GameInstallment.EXMACHINA.value],
+                      fit=ft.ImageFit.FILL, opacity=0.4),
+                ft.Container(Column([
+                      Icon(ft.icons.QUESTION_MARK_ROUNDED,
+                           size=90,
+                           color="red")],
+                      horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                      alignment=ft.alignment.center)
+                ])
+        self.logo_section.data = installment_id
+        return self.logo_section
+
+    def get_single_game_badge(self) -> ft.Container:
+        if self.single_game_badge is None:
+            self.single_game_badge = ft.Container(
+                Icon(ft.icons.BADGE_ROUNDED, color=_COLOR_PRIMARY, size=20),
+                margin=ft.margin.only(left=7, right=8))
+        return self.single_game_badge
+
+    def make_info_msg(self, game_is_running: bool, has_logo: bool) -> Row:
+        info_key = (self.app.config.lang, game_is_running, has_logo)
+        if self.info_msg_row is not None and self.info_msg_row.data == info_key:
+            return self.info_msg_row
+
+        if game_is_running:
+            self.info_msg_row = Row([
+                Icon(ft.icons.PENDING_ROUNDED,
+                     size=20,
+                     color=ft.colors.TERTIARY),
+                Text(tr("game_is_running"), color=ft.colors.TERTIARY)])
+        elif not has_logo:
+            self.info_msg_row = Row([
+                Icon(ft.icons.WARNING_ROUNDED,
+                     size=20,
+                     color=ft.colors.ERROR),
+                Text(tr("broken_game_short"), color=ft.colors.ERROR)])
+        else:
+            self.info_msg_row = Row(visible=False)
+        self.info_msg_row.data = info_key
+        return self.info_msg_row
+
+    @staticmethod
+    def make_mod_row(splited: tuple[str, ...]) -> ft.Control:
+        if len(splited) > 1:
+            return ft.Container(
+                ft.Row([
+                    Icon(ft.icons.INFO_OUTLINE_ROUNDED, color=_COLOR_SECONDARY, **_MOD_ROW_ICON_STYLE),
+                    Text(splited[0], **_MOD_ROW_TEXT_STYLE)],
+                    spacing=4, **_MOD_ROW_STYLE),
+                tooltip="\n".join(splited))
+        return ft.Row([
+            Icon(ft.icons.CIRCLE, color=_COLOR_ON_BACKGROUND, **_MOD_ROW_ICON_STYLE),
+            Text(splited[0], **_MOD_ROW_TEXT_STYLE)],
+            spacing=5, **_MOD_ROW_STYLE)
+
+    def make_mods_info(self, descriptions: tuple[tuple[str, ...], ...]) -> Column:
+        mods_key = (self.app.config.lang, descriptions)
+        if self.mods_info_column is not None and self.mods_info_column.data == mods_key:
+            return self.mods_info_column
+
+        mods_info = Column([], data=mods_key)
+        self.mods_info_column = mods_info
+        if not descriptions:
+            mods_info.visible = False
+            return mods_info
+
+        # only a few first mods are shown, others are available in a tooltip
+        mods_info.controls = [self.make_mod_row(splited)
+                              for splited in descriptions[:DISPLAY_MODS_ON_HOMESCREEN_NUM]]
+        if len(descriptions) > DISPLAY_MODS_ON_HOMESCREEN_NUM:
+            mods_info.controls.append(
+                ft.Container(
+                    Text(f"... {tr('and_others')}",
+                         size=12,
+                         color=_COLOR_ON_BACKGROUND,
+                         tooltip=self.app.game.installed_descriptions_text),
+                    margin=ft.margin.only(left=25)))
+        return mods_info
+
     def build(self) -> None:
         self.app.page.floating_action_button = ft.FloatingActionButton(
             icon=ft.icons.REFRESH_ROUNDED,
@@ -5724,130 +6073,61 @@ class HomeScreen(ft.Container):
             mini=True
             # bgcolor=ft.colors.PRIMARY
             )
-        with open(get_internal_file_path("assets/placeholder.md"), encoding="utf-8") as fh:
-            md1 = fh.read()
-            md1 = process_markdown(md1)
-
-        if self.app.game.installment_id == GameInstallment.EXMACHINA.value:
-            logo_path = "assets/em_logo.png"
-        elif self.app.game.installment_id == GameInstallment.M113.value:
-            logo_path = "assets/m113_logo.png"
-        elif self.app.game.installment_id == GameInstallment.ARCADE.value:
-            logo_path = "assets/arcade_logo.png"
-        else:
-            logo_path = None
+        md1 = _get_placeholder_md()
 
-        if logo_path is not None:
-            info_msg = Row(visible=False)
-            image = Image(src=get_internal_file_path(logo_path),
-                          fit=ft.ImageFit.FILL)
-        else:
-            image = ft.Stack([Image(src=get_internal_file_path("assets/em_logo.png"),
-                                    fit=ft.ImageFit.FILL, opacity=0.4),
-                              ft.Container(Column([
-                                    Icon(ft.icons.QUESTION_MARK_ROUNDED,
-                                         size=90,
-                                         color="red")],
-                                    horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                                    alignment=ft.alignment.center)
-                              ])
+        has_logo = self.app.game.installment_id in _GAME_LOGOS
         try:
-            if self.app.game.check_is_running():
-                self.game_is_running = True
-                info_msg = Row([
-                    Icon(ft.icons.PENDING_ROUNDED,
-                         size=20,
-                         color=ft.colors.TERTIARY),
-                    Text(tr("game_is_running"), color=ft.colors.TERTIARY)])
-            elif logo_path is None:
-                self.game_is_running = False
-                info_msg = Row([
-                    Icon(ft.icons.WARNING_ROUNDED,
-                         size=20,
-                         color=ft.colors.ERROR),
-                    Text(tr("broken_game_short"), color=ft.colors.ERROR)])
+            game_is_now_running = self.app.game.check_is_running()
         except ExeNotFoundError:
             self.content = self.get_no_game_placeholder()
             return
 
+        if game_is_now_running:
+            self.game_is_running = True
+        elif not has_logo:
+            self.game_is_running = False
+
         if not self.app.game.target_exe:
             self.content = self.get_no_game_placeholder()
             return
 
-        mods_info = Column([])
-        if self.app.game.installed_descriptions:
-            mods_text = "\n\n".join(self.app.game.installed_descriptions.values())
-            for mod_identifier in self.app.game.installed_descriptions.values():
-                if len(mods_info.controls) >= DISPLAY_MODS_ON_HOMESCREEN_NUM:
-                    mods_info.controls.append(
-                        ft.Container(
-                            Text(f"... {tr('and_others')}",
-                                 size=12,
-                                 color=ft.colors.ON_BACKGROUND,
-                                 tooltip=mods_text), margin=ft.margin.only(left=25)))
-                    break
-                splited = mod_identifier.split("\n")
-                if len(splited) > 1:
-                    mods_info.controls.append(
-                        ft.Container(
-                            ft.Row([
-                                Icon(ft.icons.INFO_OUTLINE_ROUNDED,
-                                     size=12,
-                                     color=ft.colors.SECONDARY,
-                                     expand=1),
-                                Text(splited[0],
-                                     size=12,
-                                     overflow=ft.TextOverflow.ELLIPSIS,
-                                     expand=10),
-                               ],
-                               tight=True,
-                               spacing=4,
-                               alignment=ft.MainAxisAlignment.START,
-                               vertical_alignment=ft.CrossAxisAlignment.CENTER),
-                            tooltip="\n".join(splited)))
-                else:
-                    mods_info.controls.append(
-                        ft.Row([
-                                Icon(ft.icons.CIRCLE,
-                                     size=12,
-                                     color=ft.colors.ON_BACKGROUND,
-                                     expand=1),
-                                Text(mod_identifier,
-                                     size=12,
-                                     overflow=ft.TextOverflow.ELLIPSIS,
-                                     expand=10),
-                               ],
-                               tight=True,
-                               spacing=5,
-                               alignment=ft.MainAxisAlignment.START,
-                               vertical_alignment=ft.CrossAxisAlignment.CENTER))
-        else:
-            mods_text = ""
-            mods_info.visible = False
+        # everything the page is built from; state changed afterwards by handlers
+        # (launch prompt, news, launch params) is applied to the same controls in place
+        content_key = (self.app.config.lang,
+                       self.app.config.current_game,
+                       tuple(self.app.config.game_names.items()),
+                       self.app.config.game_with_console,
+                       self.app.game.target_exe,
+                       self.app.game.exe_version,
+                       self.app.game.installed_descriptions_lines,
+                       self.app.game.fullscreen_game,
+                       self.app.game.hi_dpi_aware,
+                       self.app.game.fullscreen_opts_disabled,
+                       self.app.current_game_process is None,
+                       game_is_now_running)
+        if self.home_content is not None and self.home_content.data == content_key:
+            self.content = self.home_content
+            return
+
+        image = self.make_logo_section(self.app.game.installment_id)
+        info_msg = self.make_info_msg(game_is_now_running, has_logo)
+        mods_info = self.make_mods_info(self.app.game.installed_descriptions_lines)
+        mods_text = self.app.game.installed_descriptions_text
+        current_game_name = self.app.config.game_names.get(self.app.config.current_game)
+        exe_version = self.app.game.exe_version
+        params_disabled = exe_version == "unknown" or game_is_now_running
 
         if len(self.app.config.game_names) == 1:
-            game_selector = ft.Container(
-                Icon(ft.icons.BADGE_ROUNDED, color=ft.colors.PRIMARY, size=20),
-                margin=ft.margin.only(left=7, right=8))
+            game_selector = self.get_single_game_badge()
         else:
             game_selector = ft.PopupMenuButton(
                                 icon=ft.icons.BADGE_ROUNDED,
                                 # icon_color=ft.colors.PRIMARY,
                                 # icon_size=20,
                                 scale=0.85,
-                                tooltip=tr("select_other_game").capitalize(),
-                                items=[])
-            for key, mod_identifier in self.app.config.game_names.items():
-                game_selector.items.append(
-                    ft.PopupMenuItem(content=Text(mod_identifier), data=key,
-                                     on_click=self.select_game_from_home)
-                )
-            game_selector = ft.Container(game_selector, margin=ft.margin.only(left=-3))
-
-        try:
-            is_running_or_broken = self.app.game.check_is_running()
-        except ExeNotFoundError:
-            is_running_or_broken = True
+                                tooltip=tr_cap("select_other_game"),
+                                items=self.app.config.game_menu_items(self.select_game_from_home))
+            game_selector = ft.Container(game_selector, margin=_GAME_SELECTOR_MARGIN)
 
         self.content =\
             ft.ResponsiveRow([
@@ -5856,38 +6136,39 @@ class HomeScreen(ft.Container):
                         ft.Container(
                             Column([image],
                                    horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            margin=ft.margin.only(top=10)),
+                            margin=_HOME_SECTION_MARGIN),
                         Row([
                             game_selector,
                             ft.Column([
-                                Text(self.app.config.game_names.get(self.app.config.current_game),
-                                     color=ft.colors.PRIMARY,
+                                Text(current_game_name,
+                                     color=_COLOR_PRIMARY,
                                      overflow=ft.TextOverflow.ELLIPSIS,
                                      weight=ft.FontWeight.W_400,
-                                     tooltip=self.app.config.game_names.get(self.app.config.current_game))],
+                                     tooltip=current_game_name)],
                                 expand=True)
                             ], spacing=0, alignment=ft.MainAxisAlignment.START),
                         ft.Container(Row([
-                            Icon(ft.icons.INFO_ROUNDED, color=ft.colors.PRIMARY, size=20),
+                            Icon(ft.icons.INFO_ROUNDED, color=_COLOR_PRIMARY, size=20),
                             Text(self.app.game.exe_version_tr,
-                                 color=ft.colors.PRIMARY,
+                                 color=_COLOR_PRIMARY,
                                  tooltip=tr("exe_version") + "\n" + self.app.game.target_exe,
                                  weight=ft.FontWeight.W_700),
-                            ]), margin=ft.margin.only(left=7),
-                            visible=bool(self.app.game.exe_version)),
-                        ft.Container(info_msg, margin=ft.margin.only(left=7), visible=info_msg.visible),
+                            ]), margin=_HOME_INDENT_MARGIN,
+                            visible=bool(exe_version)),
+                        ft.Container(info_msg, margin=_HOME_INDENT_MARGIN, visible=info_msg.visible,
+                                     ref=self.info_msg),
                         ft.Tooltip(
                             message=mods_text,
                             wait_duration=100,
                             visible=bool(mods_text),
                             content=ft.Container(Row([
-                                Text(tr("has_mods").upper(),
+                                Text(tr_upper("has_mods"),
                                      weight=ft.FontWeight.BOLD,
-                                     color=ft.colors.ON_BACKGROUND)
-                                ]), margin=ft.margin.only(top=10))),
-                        ft.Container(mods_info, visible=mods_info.visible),
+                                     color=_COLOR_ON_BACKGROUND)
+                                ]), margin=_HOME_SECTION_MARGIN)),
+                        mods_info,
                         ft.Container(Column([
-                            Text(tr("actions").upper(),
+                            Text(tr_upper("actions"),
                                  weight=ft.FontWeight.BOLD),
                             ft.Tooltip(
                                 message=tr("open_in_explorer"),
@@ -5896,85 +6177,46 @@ class HomeScreen(ft.Container):
                                     text=tr("open_in_explorer"),
                                     icon=icons.FOLDER_OPEN,
                                     on_click=self.open_clicked))
-                        ]), margin=ft.margin.only(top=10))
+                        ]), margin=_HOME_SECTION_MARGIN)
                     ]), clip_behavior=ft.ClipBehavior.ANTI_ALIAS),
                     # Text(self.app.context.distribution_dir),
                     # Text(self.app.context.commod_version),
                     # Text(self.app.game.game_root_path),
                     # Text(self.app.game.display_name),
                     Column([
-                        Row([Text(tr("launch_params").upper(),
+                        Row([Text(tr_upper("launch_params"),
                                   weight=ft.FontWeight.BOLD),
-                             ft.PopupMenuButton(items=[
-                                ft.PopupMenuItem(
-                                    content=Row([Icon(ft.icons.FULLSCREEN_ROUNDED),
-                                                 Text(tr("windowed_mode").capitalize(),
-                                                      width=160,
-                                                      size=13)]),
-                                    checked=not self.app.game.fullscreen_game,
-                                    on_click=self.switch_to_windowed,
-                                    ref=self.checkbox_windowed_game),
-                                ft.PopupMenuItem(
-                                    content=Row([Icon(ft.icons.FOUR_K_ROUNDED),
-                                                 Text(tr("hi_dpi_aware"),
-                                                      width=160,
-                                                      size=13)]),
-                                    checked=self.app.game.hi_dpi_aware,
-                                    on_click=self.switch_to_hidpi_aware,
-                                    ref=self.checkbox_hi_dpi_aware,
-                                    disabled=not self.app.context.under_windows),
-                                ft.PopupMenuItem(
-                                    content=Row([Icon(ft.icons.SETTINGS_APPLICATIONS_OUTLINED),
-                                                 Text(tr("fullscreen_optimizations"),
-                                                      width=160,
-                                                      size=13)]),
-                                    checked=self.app.game.fullscreen_opts_disabled,
-                                    on_click=self.switch_fullscreen_optimizations,
-                                    ref=self.checkbox_fullsreen_opts,
-                                    disabled=not self.app.context.under_windows),
-                                ft.PopupMenuItem(),
-                                ft.PopupMenuItem(
-                                    content=ft.Container(
-                                        Row([Icon(ft.icons.QUESTION_MARK_OUTLINED,
-                                                  color=ft.colors.ON_BACKGROUND),
-                                             Text(tr("launch_options_instructions").capitalize(),
-                                                  width=190,
-                                                  size=13)]),
-                                        margin=ft.margin.only(left=15)),
-                                    on_click=self.show_launch_opts_instruction)
-                                ],
-                                disabled=self.app.game.exe_version == "unknown"
-                                         or is_running_or_broken,
-                                ref=self.launch_params_menu,
-                                tooltip=tr("launch_params").capitalize())
+                             LaunchParamsMenu(
+                                self,
+                                disabled=params_disabled,
+                                ref=self.launch_params_menu)
                              ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
                         ft.Container(
                             Row([ft.Switch(
                                     value=self.app.config.game_with_console,
                                     scale=0.7,
-                                    disabled=self.app.game.exe_version == "unknown"
-                                             or is_running_or_broken,
+                                    disabled=params_disabled,
                                     on_change=self.change_game_console_mode,
                                     ref=self.game_console_switch),
-                                 Text(tr("enable_console").capitalize(),
+                                 Text(tr_cap("enable_console"),
                                       weight=ft.FontWeight.W_500)
-                                 ], spacing=0), margin=ft.margin.only(bottom=10)),
+                                 ], spacing=0), margin=_HOME_PARAMS_MARGIN),
                         ft.FloatingActionButton(
                             content=ft.Row([
-                                ft.ProgressRing(visible=False,
-                                                color=ft.colors.ON_PRIMARY,
+                                ft.ProgressRing(visible=self.launching_prompt_shown,
+                                                color=_COLOR_ON_PRIMARY,
                                                 scale=0.7,
                                                 ref=self.launch_prog_ring),
-                                ft.Text(tr("play").capitalize(), size=20,
+                                ft.Text(self.get_launch_btn_prompt(), size=20,
                                         weight=ft.FontWeight.W_700,
                                         ref=self.launch_game_btn_text,
-                                        color=ft.colors.ON_PRIMARY)],
+                                        color=_COLOR_ON_PRIMARY)],
                                 alignment="center", spacing=5
                             ),
                             shape=ft.RoundedRectangleBorder(radius=5),
                             bgcolor="#FFA500",
                             ref=self.launch_game_btn,
-                            disabled=self.app.game.exe_version == "unknown"
+                            disabled=exe_version == "unknown"
                                      or not self.app.context.under_windows,
                             on_click=self.launch_game,
                             aspect_ratio=2.5,
@@ -5985,15 +6227,19 @@ class HomeScreen(ft.Container):
                     Row([ft.ProgressRing(scale=0.5), Text(tr("checking_online_news"))],
                         ref=self.checking_online, visible=self.news_text is None),
                     ft.Container(ft.Markdown(
-                        md1,
+                        # placeholder is kept hidden while news are loading, to render markdown only once
+                        md1 if self.news_text is None else self.news_text,
+                        visible=self.news_text is not None or self.offline,
                         expand=True,
                         code_theme="atom-one-dark",
                         extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
                         auto_follow_links=True,
                         ref=self.markdown_content,
-                    ), padding=ft.padding.only(left=10, right=22)),
+                    ), padding=_NEWS_PADDING, clip_behavior=ft.ClipBehavior.HARD_EDGE),
                     ],
                     alignment=ft.MainAxisAlignment.START,
                     spacing=20,
                     scroll=ft.ScrollMode.ADAPTIVE), col={"xs": 16, "xl": 17, "xxl": 18})
-                ], vertical_alignment=ft.CrossAxisAlignment.START, spacing=30, columns=24)
+                ], vertical_alignment=ft.CrossAxisAlignment.START, spacing=30, columns=24,
+                data=content_key)
+        self.home_content = self.content
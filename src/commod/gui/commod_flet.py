@@ -12,7 +12,7 @@ from commod.gui.common_widgets import title_btn_style
 from commod.gui.config import AppSections, Config
 from commod.helpers.file_ops import get_internal_file_path
 from commod.helpers.parse_ops import init_input_parser
-from commod.localisation.service import tr
+from commod.localisation.service import tr, tr_cap
 
 
 async def main(page: Page) -> None:
@@ -136,22 +136,22 @@ async def main(page: Page) -> None:
             ft.NavigationRailDestination(
                 icon=ft.icons.ROCKET_LAUNCH_OUTLINED,
                 selected_icon=ft.icons.ROCKET_LAUNCH,
-                label=tr("launch").capitalize()
+                label=tr_cap("launch")
             ),
             ft.NavigationRailDestination(
                 icon=ft.icons.BOOKMARK_BORDER,
                 selected_icon=ft.icons.BOOKMARK,
-                label=tr("local_mods").capitalize(),
+                label=tr_cap("local_mods"),
             ),
             ft.NavigationRailDestination(
                 icon=ft.icons.DOWNLOAD_OUTLINED,
                 selected_icon=ft.icons.DOWNLOAD,
-                label=tr("download").capitalize()
+                label=tr_cap("download")
             ),
             ft.NavigationRailDestination(
                 icon=ft.icons.SETTINGS_OUTLINED,
                 selected_icon=ft.icons.SETTINGS,
-                label=tr("settings").capitalize()
+                label=tr_cap("settings")
             )
         ],
         trailing=ft.Tooltip(
@@ -1,4 +1,6 @@
 import os
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any
 
@@ -8,6 +10,9 @@ import commod.localisation.service as localisation
 from commod.game.environment import GameCopy, GameInstallment, InstallationContext
 from commod.helpers.file_ops import dump_yaml, read_yaml
 
+# fewer paths are checked in place, as starting a thread pool would cost more than it saves
+_MIN_PATHS_FOR_POOL = 2
+
 
 class AppSections(Enum):
     LAUNCH = 0
@@ -20,7 +25,16 @@ class AppSections(Enum):
         return [c.value for c in cls]
 
 
+# for membership checks, members never change so it's computed once
+AppSections.VALUES = frozenset(AppSections.list_values())
+
+
 class Config:
+    __slots__ = ("_game_menu_items", "_game_menu_on_click", "_lang", "current_distro", "current_game",
+                 "current_game_filter", "current_section", "game_names", "game_with_console", "init_height",
+                 "init_pos_x", "init_pos_y", "init_theme", "init_width", "known_distros", "known_games",
+                 "linux_run_cmd", "loaded_games", "modder_mode", "override_incompat", "page")
+
     def __init__(self, page: ft.Page) -> None:
         self.init_width: int = 900
         self.init_height: int = 700
@@ -31,8 +45,14 @@ class Config:
         self._lang: str = localisation.stored.language
 
         self.current_game: str = ""
+        # edited through set_game_name and remove_game to keep known_games in sync
         self.game_names: dict[str, str] = {}
+        # lowercase paths of all known games
+        self.known_games: set[str] = set()
         self.loaded_games: dict[str, GameCopy] = {}
+        # game selection menu items, rebuilt only when known games change
+        self._game_menu_items: list[ft.PopupMenuItem] | None = None
+        self._game_menu_on_click: Callable[[ft.ControlEvent], Awaitable[None]] | None = None
 
         self.current_distro: str = ""
         # pretty much useless right now as only single distro is supported at the same time
@@ -67,9 +87,32 @@ class Config:
             "lang": self.lang
         }
 
-    @property
-    def known_games(self) -> set[str]:
-        return {game_path.lower() for game_path in self.game_names}
+    def set_game_name(self, game_path: str, name: str) -> None:
+        self.game_names[game_path] = name
+        self.known_games.add(game_path.lower())
+        self._game_menu_items = None
+
+    def remove_game(self, game_path: str) -> None:
+        self.game_names.pop(game_path)
+        self._game_menu_items = None
+        # other paths can differ only by case, which still point to the same game
+        if not any(path.lower() == game_path.lower() for path in self.game_names):
+            self.known_games.discard(game_path.lower())
+
+    def game_menu_items(self, on_click: Callable[[ft.ControlEvent], Awaitable[None]]
+                        ) -> list[ft.PopupMenuItem]:
+        """Return menu items for switching between known games.
+
+        Same items are returned until game names or click handler change
+        """
+        # game_names is only edited through set_game_name, remove_game and load_from_file,
+        # which drop the cached items
+        if self._game_menu_items is None or on_click != self._game_menu_on_click:
+            self._game_menu_items = [
+                ft.PopupMenuItem(content=ft.Text(game_name), data=game_path, on_click=on_click)
+                for game_path, game_name in self.game_names.items()]
+            self._game_menu_on_click = on_click
+        return self._game_menu_items
 
     def get_game_copy(self, game_path: str | None = None,
                       reset_cache: bool = False) -> GameCopy:
@@ -86,10 +129,19 @@ class Config:
 
     @lang.setter
     def lang(self, new_lang: localisation.SupportedLanguages) -> None:
-        if isinstance(new_lang, str) and new_lang in localisation.SupportedLanguages.list_values():
+        if isinstance(new_lang, str) and new_lang in localisation.SupportedLanguages.VALUES:
             self._lang = new_lang
             localisation.stored.language = new_lang
 
+    @staticmethod
+    def get_existing_dirs(paths: set[str]) -> set[str]:
+        """Return paths from the given set which are existing directories, checked concurrently."""
+        if len(paths) < _MIN_PATHS_FOR_POOL:
+            return {path for path in paths if os.path.isdir(path)}
+        with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+            checks = executor.map(os.path.isdir, paths)
+            return {path for path, is_dir in zip(paths, checks, strict=True) if is_dir}
+
     def load_from_file(self, abs_path: str | None = None) -> None:
         if abs_path is not None and os.path.exists(abs_path):
             config = read_yaml(abs_path)
@@ -97,23 +149,31 @@ class Config:
             config = InstallationContext.get_commod_config()
 
         if isinstance(config, dict):
+            # all stored paths are checked at once, as stat calls are slow on network and cold drives
+            game_names = config.get("game_names")
+            current_game = config.get("current_game")
+            current_distro = config.get("current_distro")
+            paths_to_check = {path for path in (current_game, current_distro) if isinstance(path, str)}
+            if isinstance(game_names, dict):
+                paths_to_check.update(path for path in game_names if isinstance(path, str))
+            existing_dirs = self.get_existing_dirs(paths_to_check)
+
             lang = config.get("lang")
-            if isinstance(lang, str) and lang in localisation.SupportedLanguages.list_values():
+            if isinstance(lang, str) and lang in localisation.SupportedLanguages.VALUES:
                 self._lang = lang
                 localisation.stored.language = lang
 
-            current_game = config.get("current_game")
-            if isinstance(current_game, str) and os.path.isdir(current_game):
+            if isinstance(current_game, str) and current_game in existing_dirs:
                 self.current_game = current_game
 
-            game_names = config.get("game_names")
             if isinstance(game_names, dict):
                 for path, name in game_names.items():
-                    if isinstance(path, str) and os.path.isdir(path) and (name is not None):
+                    if isinstance(path, str) and path in existing_dirs and (name is not None):
                         self.game_names[path] = str(name)
+                self.known_games = {game_path.lower() for game_path in self.game_names}
+                self._game_menu_items = None
 
-            current_distro = config.get("current_distro")
-            if isinstance(current_distro, str) and os.path.isdir(current_distro):
+            if isinstance(current_distro, str) and current_distro in existing_dirs:
                 self.current_distro = current_distro
 
             self.known_distros = {self.current_distro}
@@ -127,11 +187,11 @@ class Config:
                 self.override_incompat = override_incompat
 
             current_section = config.get("current_section")
-            if current_section in AppSections.list_values():
+            if isinstance(current_section, int) and current_section in AppSections.VALUES:
                 self.current_section = current_section
 
             current_game_filter = config.get("current_game_filter")
-            if current_game_filter in GameInstallment.list_values():
+            if isinstance(current_game_filter, int) and current_game_filter in GameInstallment.VALUES:
                 self.current_game_filter = current_game_filter
 
             game_with_console = config.get("game_with_console")
@@ -144,16 +204,11 @@ class Config:
 
             window_config = config.get("window")
             # ignoring broken partial configs for window
-            if (isinstance(window_config, dict)
-                and isinstance(window_config.get("width"), float)
-                and isinstance(window_config.get("height"), float)
-                and isinstance(window_config.get("pos_x"), float)
-                and isinstance(window_config.get("pos_y"), float)):
-                # TODO: validate that window is not completely outside the screen area
-                self.init_height = window_config["height"]
-                self.init_width = window_config["width"]
-                self.init_pos_x = window_config["pos_x"]
-                self.init_pos_y = window_config["pos_y"]
+            if isinstance(window_config, dict):
+                window_values = tuple(window_config.get(key) for key in ("width", "height", "pos_x", "pos_y"))
+                if all(type(value) is float for value in window_values):
+                    # TODO: validate that window is not completely outside the screen area
+                    self.init_width, self.init_height, self.init_pos_x, self.init_pos_y = window_values
 
             theme = config.get("theme")
             if theme in ("system", "light", "dark"):
@@ -161,8 +216,7 @@ class Config:
 
     def add_game_to_config(self, game_path: str, name: str = "Ex Machina") -> None:
         if os.path.isdir(game_path):
-            self.game_names[game_path] = name
-            self.known_games.add(game_path.lower())
+            self.set_game_name(game_path, name)
             self.current_game = game_path
 
     def add_distro_to_config(self, distro_path: str) -> None:
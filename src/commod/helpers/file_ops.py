@@ -10,7 +10,8 @@ import subprocess
 import sys
 import typing
 import zipfile
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Iterable
+from functools import lru_cache
 from math import ceil
 from pathlib import Path
 from typing import Any
@@ -300,9 +301,13 @@ async def extract_7z_from_to(archive_path: str | Path, to_path: str | Path,
             await extract_files_from_7z(archive, file_names, to_path, callback, files_num, chunksize)
 
 
+# libyaml based loader is much faster, but PyYAML can be built without it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_yaml(stream: typing.IO) -> Any:  # noqa: ANN401
     try:
-        return yaml.safe_load(stream)
+        return yaml.load(stream, Loader=YAML_LOADER)  # noqa: S506
     except yaml.YAMLError:
         logger.exception("Unable to load yaml")
         return None
@@ -327,8 +332,13 @@ def dump_yaml(data: Any, path: str | Path, sort_keys: bool = True) -> bool:  # n
     return True
 
 
+# root of the package, internal files (assets, localisation) are looked up relative to it
+INTERNAL_FILES_ROOT = Path(__file__).parent.parent
+
+
+@lru_cache(maxsize=128)
 def get_internal_file_path(file_name: str) -> Path:
-    return Path(__file__).parent.parent / file_name
+    return INTERNAL_FILES_ROOT / file_name
 
 
 def patch_offsets(f: typing.BinaryIO,
@@ -369,17 +379,28 @@ def running_in_venv() -> bool:
             sys.base_prefix != sys.prefix))
 
 
-def get_proc_by_names(proc_names: list[str]) -> psutil.Process | None:
+# names searched by get_proc_by_names -> last process found by them, checked first on subsequent calls
+_found_procs: dict[frozenset[str], psutil.Process] = {}
+
+
+def get_proc_by_names(proc_names: Iterable[str]) -> psutil.Process | None:
     """Return one proccess matching given list of names or None."""
-    for p in psutil.process_iter():
-        name = ""
+    proc_names = frozenset(proc_names)
+
+    # is_running also compares process creation time, so reused pids are not mistaken for the same process
+    last_found = _found_procs.pop(proc_names, None)
+    if last_found is not None:
         try:
-            name = p.name()
-        except (psutil.AccessDenied, psutil.ZombieProcess):
+            if last_found.is_running():
+                _found_procs[proc_names] = last_found
+                return last_found
+        except psutil.Error:
             pass
-        except psutil.NoSuchProcess:
-            continue
-        if name in proc_names:
+
+    # names are requested in bulk, inaccessible ones are returned as None
+    for p in psutil.process_iter(["name"]):
+        if p.info["name"] in proc_names:
+            _found_procs[proc_names] = p
             return p
     return None
 
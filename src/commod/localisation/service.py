@@ -2,6 +2,7 @@ import locale
 import logging
 from dataclasses import dataclass
 from enum import Enum, StrEnum, auto
+from functools import lru_cache
 
 from commod.game.data import OWN_VERSION
 from commod.helpers.file_ops import get_internal_file_path, read_yaml
@@ -54,6 +55,9 @@ class SupportedLanguages(StrEnum):
                 return member
         return None
 
+# for membership checks, members never change so it's computed once
+SupportedLanguages.VALUES = frozenset(SupportedLanguages.list_values())
+
 # Fallback for new lines that are added in development,
 # before they can be translated to all supported langs
 local_dict: dict[str, str] = {
@@ -75,6 +79,12 @@ def get_strings_dict() -> dict[str, dict[str, str]]:
     for key in ukr:
         loc_dict[key][SupportedLanguages.UA.value] = ukr[key]
 
+    # version is substituted once on load instead of on every lookup
+    for translations in loc_dict.values():
+        for lang, value in translations.items():
+            if "{OWN_VERSION}" in value:
+                translations[lang] = value.replace("{OWN_VERSION}", OWN_VERSION)
+
     return loc_dict
 
 
@@ -93,12 +103,9 @@ def tr(str_name: str, **kwargs: str) -> str:
     """
     loc_str = stored.strings.get(str_name)
     if loc_str is not None:
-        final_string = loc_str[stored.language]
-        if "{OWN_VERSION}" in final_string:
-            final_string = final_string.replace("{OWN_VERSION}", OWN_VERSION)
         if kwargs:
-            final_string = final_string.format(**kwargs)
-        return final_string
+            return loc_str[stored.language].format(**kwargs)
+        return loc_str[stored.language]
 
     # development fallback
     if local_dict.get(str_name):
@@ -107,6 +114,21 @@ def tr(str_name: str, **kwargs: str) -> str:
     logger.warning(f"Localized string '{str_name}' not found!")
     return f"Unlocalised string '{str_name}'"
 
+@lru_cache(maxsize=512)
+def _tr_cased(str_name: str, lang: str, case: str) -> str:
+    return getattr(tr(str_name), case)()
+
+def tr_cap(str_name: str) -> str:
+    """Return capitalised localised string based on the current locale language.
+
+    Results are cached per language, so switching languages doesn't require invalidation
+    """
+    return _tr_cased(str_name, stored.language, "capitalize")
+
+def tr_upper(str_name: str) -> str:
+    """Return uppercase localised string based on the current locale language, cached like tr_cap."""
+    return _tr_cased(str_name, stored.language, "upper")
+
 def get_default_lang() -> str:
     def_locale_tuple = locale.getlocale()
     if isinstance(def_locale_tuple[0], str):
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import flet as ft
+
+from commod.game.environment import GameCopy
+from commod.gui.app_widgets import App, HomeScreen
+from commod.gui.config import Config
+
+
+def make_app() -> App:
+    page = SimpleNamespace(window_width=900.0, window_height=700.0, window_left=0.0, window_top=0.0,
+                           theme_mode=ft.ThemeMode.SYSTEM, update=lambda *controls: None)
+    game = GameCopy()
+    game.target_exe = "hta.exe"
+    game.exe_version = "1.02"
+    game.installment_id = 1
+    game.check_is_running = lambda: False
+
+    config = Config(page)
+    config.current_game = "game_path"
+    config.game_names = {"game_path": "Ex Machina"}
+    context = SimpleNamespace(under_windows=True, logger=None)
+    return App(context=context, game=game, config=config, page=page)
+
+
+def test_fresh_home_screen_builds_before_mount() -> None:
+    home = HomeScreen(make_app())
+    home.build()
+
+    assert isinstance(home.content, ft.ResponsiveRow)
+    # news are still loading, so markdown stays hidden until did_mount gets them
+    assert home.markdown_content.current.visible is False
+
+
+def test_double_click_during_launch_keeps_params_disabled() -> None:
+    app = make_app()
+    home = HomeScreen(app)
+    home.build()
+
+    async def click_while_launching() -> None:
+        # game was just started and launching prompt is still shown
+        app.current_game_process = SimpleNamespace(returncode=None)
+        app.game_change_time = time.monotonic()
+        home.launch_prompt_task = asyncio.create_task(asyncio.sleep(10))
+        home.set_launch_params_disabled(True)
+        home.launch_prog_ring.current.visible = True
+
+        await home.launch_game(None)
+
+        home.launch_prompt_task.cancel()
+
+    asyncio.run(click_while_launching())
+
+    assert home.launch_params_menu.current.disabled is True
+    assert home.game_console_switch.current.disabled is True
+    assert home.launch_prog_ring.current.visible is True
+
+
+def test_single_game_badge_is_reused_by_its_screen_only() -> None:
+    home = HomeScreen(make_app())
+    other_home = HomeScreen(make_app())
+
+    assert home.get_single_game_badge() is home.get_single_game_badge()
+    assert home.get_single_game_badge() is not other_home.get_single_game_badge()
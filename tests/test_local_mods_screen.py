@@ -0,0 +1,50 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from commod.gui.app_widgets import App, LocalModsScreen
+
+
+def make_mod(name: str, version: str) -> SimpleNamespace:
+    mod = SimpleNamespace(name=name, installment="exmachina", id_str=f"{name}_{version}",
+                          can_install=False, translations_loaded={})
+    mod.id_str_lower = mod.id_str.lower()
+    mod.variants_loaded = {name: mod}
+    return mod
+
+
+def make_app(mods: list[SimpleNamespace]) -> App:
+    async def load_distro_async() -> None:
+        pass
+
+    session = SimpleNamespace(mods={mod.id_str: mod for mod in mods})
+    context = SimpleNamespace(distribution_dir="distro", archived_mods={},
+                              logger=logging.getLogger("test"), current_session=session)
+    config = SimpleNamespace(current_distro="distro", current_game="game_path", lang="eng")
+    game = SimpleNamespace(installed_content={}, game_root_path="game_path")
+    app = App(context=context, game=game, config=config, page=None)
+    app.load_distro_async = load_distro_async
+    return app
+
+
+def shown_ids(screen: LocalModsScreen) -> set[str]:
+    return {mod_id for family in screen.mods_list_view.current.controls for mod_id in family.main_mod_ids}
+
+
+def test_update_list_keeps_shown_mods_on_repeated_calls() -> None:
+    app = make_app([make_mod("first", "1"), make_mod("first", "2"), make_mod("second", "1")])
+    screen = LocalModsScreen(app)
+    screen.update = lambda: None
+    screen.build()
+
+    asyncio.run(screen.update_list())
+    assert shown_ids(screen) == {"first_1", "first_2", "second_1"}
+    assert len(screen.mods_list_view.current.controls) == 2
+
+    asyncio.run(screen.update_list())
+    assert shown_ids(screen) == {"first_1", "first_2", "second_1"}
+    assert len(screen.mods_list_view.current.controls) == 2
+
+    app.session.mods.pop("second_1")
+    asyncio.run(screen.update_list())
+    assert shown_ids(screen) == {"first_1", "first_2"}